@@ -1,13 +1,35 @@
 """Adapters package for external integrations."""
 
-from .config import ConfigAdapter
-from .db import DatabaseAdapter
-from .graph_api import GraphAPIAdapter
-from .external_api import ExternalAPIAdapter
+from importlib import import_module
 
 __all__ = [
     "ConfigAdapter",
+    "get_config_adapter",
     "DatabaseAdapter", 
     "GraphAPIAdapter",
     "ExternalAPIAdapter",
 ]
+
+# Submodule providing each public name; imported on first attribute access so
+# that e.g. `adapters.config` does not pull in SQLAlchemy, MSAL and httpx
+_SUBMODULE_BY_NAME = {
+    "ConfigAdapter": ".config",
+    "get_config_adapter": ".config",
+    "DatabaseAdapter": ".db",
+    "GraphAPIAdapter": ".graph_api",
+    "ExternalAPIAdapter": ".external_api",
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names from their submodule on first use (PEP 562)."""
+    submodule = _SUBMODULE_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -6,8 +6,7 @@ from typing import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from config.settings import get_config
-from adapters.config import ConfigAdapter
+from adapters.config import ConfigAdapter, get_config_adapter
 from adapters.db.database import initialize_database
 from adapters.db.repositories import (
     SQLUserRepository, SQLAccountRepository,
@@ -15,6 +14,7 @@ from adapters.db.repositories import (
 )
 from adapters.graph_api import GraphAPIAdapter
 from adapters.external_api import ExternalAPIAdapter
+from adapters.common.http_utils import HTTPClientUtils
 
 from core.usecases.account_management import AccountManagementUseCase
 from core.usecases.email_detection import EmailDetectionUseCase
@@ -34,7 +34,10 @@ def get_config_dependency() -> ConfigAdapter:
     """Get configuration dependency."""
     global _config
     if _config is None:
-        _config = ConfigAdapter(get_config())
+        config = get_config_adapter()
+        # Production-only checks run once here instead of on every Settings construction
+        config.validate_required_settings()
+        _config = config
         logger.info("Configuration initialized")
     return _config
 
@@ -74,6 +77,14 @@ def get_external_api_dependency(config: ConfigAdapter = Depends(get_config_depen
     return _external_api
 
 
+async def get_readonly_db_session(
+    db_adapter = Depends(get_db_adapter_dependency)
+) -> AsyncGenerator[AsyncSession, None]:
+    """Get read-only database session dependency (never committed)."""
+    async with db_adapter.readonly_session_scope() as session:
+        yield session
+
+
 # Repository dependencies
 def get_user_repository(session: AsyncSession = Depends(get_db_session)) -> SQLUserRepository:
     """Get user repository dependency."""
@@ -141,6 +152,50 @@ def get_transmission_usecase(
     )
 
 
+# Read-only use case dependencies for GET endpoints; repositories share one
+# session that is closed without a COMMIT
+def get_readonly_account_usecase(
+    session: AsyncSession = Depends(get_readonly_db_session),
+    graph_api: GraphAPIAdapter = Depends(get_graph_api_dependency),
+    config: ConfigAdapter = Depends(get_config_dependency)
+) -> AccountManagementUseCase:
+    """Get account management use case dependency for read-only requests."""
+    return AccountManagementUseCase(
+        user_repository=SQLUserRepository(session),
+        account_repository=SQLAccountRepository(session),
+        graph_api=graph_api,
+        config=config
+    )
+
+
+def get_readonly_email_usecase(
+    session: AsyncSession = Depends(get_readonly_db_session),
+    graph_api: GraphAPIAdapter = Depends(get_graph_api_dependency),
+    config: ConfigAdapter = Depends(get_config_dependency)
+) -> EmailDetectionUseCase:
+    """Get email detection use case dependency for read-only requests."""
+    return EmailDetectionUseCase(
+        account_repository=SQLAccountRepository(session),
+        email_repository=SQLEmailRepository(session),
+        graph_api=graph_api,
+        config=config
+    )
+
+
+def get_readonly_transmission_usecase(
+    session: AsyncSession = Depends(get_readonly_db_session),
+    external_api: ExternalAPIAdapter = Depends(get_external_api_dependency),
+    config: ConfigAdapter = Depends(get_config_dependency)
+) -> ExternalTransmissionUseCase:
+    """Get external transmission use case dependency for read-only requests."""
+    return ExternalTransmissionUseCase(
+        email_repository=SQLEmailRepository(session),
+        transmission_repository=SQLTransmissionRecordRepository(session),
+        external_api=external_api,
+        config=config
+    )
+
+
 # Convenience function for getting all dependencies
 def get_dependencies():
     """Get all dependencies for manual initialization."""
@@ -169,6 +224,8 @@ async def cleanup_dependencies():
         if _db_adapter:
             await _db_adapter.close()
             logger.info("Database adapter closed")
+        
+        await HTTPClientUtils.close_shared_client()
             
     except Exception as e:
         logger.error(f"Error during cleanup: {e}")
@@ -10,6 +10,7 @@ from fastapi.responses import JSONResponse
 
 from .dependencies import (
     get_account_usecase, get_email_usecase, get_transmission_usecase,
+    get_readonly_account_usecase, get_readonly_email_usecase, get_readonly_transmission_usecase,
     get_config_dependency, get_graph_api_dependency, get_external_api_dependency,
     get_db_adapter_dependency
 )
@@ -90,7 +91,7 @@ def create_account_router() -> APIRouter:
         active_only: bool = Query(False, description="Show only active accounts"),
         page: int = Query(1, ge=1, description="Page number"),
         size: int = Query(20, ge=1, le=100, description="Page size"),
-        account_usecase: AccountManagementUseCase = Depends(get_account_usecase)
+        account_usecase: AccountManagementUseCase = Depends(get_readonly_account_usecase)
     ):
         """List accounts with optional filtering."""
         try:
@@ -146,7 +147,7 @@ def create_account_router() -> APIRouter:
     @router.get("/{account_id}", response_model=AccountResponse)
     async def get_account(
         account_id: UUID,
-        account_usecase: AccountManagementUseCase = Depends(get_account_usecase)
+        account_usecase: AccountManagementUseCase = Depends(get_readonly_account_usecase)
     ):
         """Get account by ID."""
         try:
@@ -277,7 +278,7 @@ def create_email_router() -> APIRouter:
         sender: Optional[str] = Query(None, description="Filter by sender"),
         page: int = Query(1, ge=1, description="Page number"),
         size: int = Query(20, ge=1, le=100, description="Page size"),
-        email_usecase: EmailDetectionUseCase = Depends(get_email_usecase)
+        email_usecase: EmailDetectionUseCase = Depends(get_readonly_email_usecase)
     ):
         """List emails with optional filtering."""
         try:
@@ -305,7 +306,7 @@ def create_email_router() -> APIRouter:
     @router.get("/{email_id}", response_model=EmailResponse)
     async def get_email(
         email_id: UUID,
-        email_usecase: EmailDetectionUseCase = Depends(get_email_usecase)
+        email_usecase: EmailDetectionUseCase = Depends(get_readonly_email_usecase)
     ):
         """Get email by ID."""
         try:
@@ -373,7 +374,7 @@ def create_transmission_router() -> APIRouter:
         status: Optional[str] = Query(None, description="Filter by transmission status"),
         page: int = Query(1, ge=1, description="Page number"),
         size: int = Query(20, ge=1, le=100, description="Page size"),
-        transmission_usecase: ExternalTransmissionUseCase = Depends(get_transmission_usecase)
+        transmission_usecase: ExternalTransmissionUseCase = Depends(get_readonly_transmission_usecase)
     ):
         """List transmission records with optional filtering."""
         try:
@@ -462,7 +463,7 @@ def create_transmission_router() -> APIRouter:
     
     @router.get("/summary", response_model=TransmissionSummaryResponse)
     async def get_transmission_summary(
-        transmission_usecase: ExternalTransmissionUseCase = Depends(get_transmission_usecase)
+        transmission_usecase: ExternalTransmissionUseCase = Depends(get_readonly_transmission_usecase)
     ):
         """Get transmission status summary."""
         try:
@@ -4,18 +4,19 @@ import asyncio
 import json
 import logging
 from datetime import datetime
+from functools import wraps
 from typing import Optional, List
 from uuid import UUID
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich import print as rprint
 
-from config.settings import get_config
-from adapters.config import ConfigAdapter
+from adapters.common.http_utils import HTTPClientUtils
+from adapters.config import ConfigAdapter, get_config_adapter
 from adapters.db.database import initialize_database, migrate_database_sync
 from adapters.db.repositories import (
     SQLUserRepository, SQLAccountRepository, 
@@ -62,10 +63,70 @@ app.add_typer(config_app, name="config")
 app.add_typer(multi_app, name="multi")
 
 
+def _fmt_ts(dt: Optional[datetime], missing: str = "Never") -> str:
+    """Format a timestamp as ``YYYY-MM-DD HH:MM`` for table output.
+
+    ``str(datetime)`` is rendered in C and already ISO-ordered, so slicing it
+    avoids running the ``strftime`` format parser once per table row.
+    """
+    return missing if dt is None else str(dt)[:16]
+
+
+def _fmt_short_ts(dt: Optional[datetime], missing: str = "N/A") -> str:
+    """Format a timestamp as ``MM-DD HH:MM`` for table output."""
+    return missing if dt is None else str(dt)[5:16]
+
+
+def _run_async(coro):
+    """
+    Run a coroutine on a fresh event loop, like asyncio.run().
+    
+    Also closes that loop's shared HTTP client, which is bound to the loop and
+    would otherwise be left open when asyncio.run() discards it.
+    """
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await HTTPClientUtils.close_shared_client()
+    
+    return asyncio.run(runner())
+
+
+def _cli_safe(action: str):
+    """
+    Report unexpected command errors and exit with status 1.
+    
+    Args:
+        action: Short description used in the error message, e.g. "listing accounts"
+    """
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except (typer.Exit, typer.Abort):
+                raise
+            except Exception as e:
+                console.print(f"[red]Error {action}: {e}[/red]")
+                raise typer.Exit(1) from e
+        return wrapper
+    return decorator
+
+
 # Global dependencies
+def get_cli_config() -> ConfigAdapter:
+    """Get the configuration adapter shared by all CLI commands in this process."""
+    config = get_config_adapter()
+    # Production-only checks (required settings, placeholder secret key) run
+    # here, as in the API's get_config_dependency(), not at construction time
+    config.validate_required_settings()
+    return config
+
+
 def get_dependencies():
     """Get initialized dependencies for CLI commands."""
-    config = ConfigAdapter(get_config())
+    config = get_cli_config()
     db_adapter = initialize_database(config)
     
     # Get sync session for CLI operations
@@ -135,556 +196,534 @@ def create_multi_account_manager(deps):
 
 # Multi-account management commands
 @multi_app.command("sync-all")
+@_cli_safe("syncing accounts")
 def sync_all():
     """Sync all active accounts."""
-    try:
-        deps = get_dependencies()
-        multi_account_manager = create_multi_account_manager(deps)
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Syncing all accounts...", total=None)
-            
-            result = asyncio.run(multi_account_manager.sync_all_accounts(
-                MultiAccountSyncRequest(sync_active_only=True)
-            ))
-        
-        console.print(f"[green]✅ Synced {result.successful_syncs}/{result.total_accounts} accounts[/green]")
-        console.print(f"📧 Detected {result.total_emails_detected} emails")
-        console.print(f"📤 Transmitted {result.total_emails_transmitted} emails")
-        console.print(f"⏱️ Total duration: {result.total_duration_ms}ms")
+    deps = get_dependencies()
+    multi_account_manager = create_multi_account_manager(deps)
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Syncing all accounts...", total=None)
+        
+        result = _run_async(multi_account_manager.sync_all_accounts(
+            MultiAccountSyncRequest(sync_active_only=True)
+        ))
+    
+    renderables = [
+        f"[green]✅ Synced {result.successful_syncs}/{result.total_accounts} accounts[/green]\n"
+        f"📧 Detected {result.total_emails_detected} emails\n"
+        f"📤 Transmitted {result.total_emails_transmitted} emails\n"
+        f"⏱️ Total duration: {result.total_duration_ms}ms"
+    ]
+    
+    if result.account_results:
+        # Show detailed results table
+        table = Table(title="Account Sync Results")
+        table.add_column("Email", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Emails", style="yellow")
+        table.add_column("Transmitted", style="blue")
+        table.add_column("Duration", style="magenta")
         
-        if result.account_results:
-            # Show detailed results table
-            table = Table(title="Account Sync Results")
-            table.add_column("Email", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Emails", style="yellow")
-            table.add_column("Transmitted", style="blue")
-            table.add_column("Duration", style="magenta")
-            
-            for account_result in result.account_results:
-                status_color = "green" if account_result.status == "success" else "red"
-                table.add_row(
-                    account_result.email,
-                    f"[{status_color}]{account_result.status}[/{status_color}]",
-                    str(account_result.emails_detected),
-                    str(account_result.emails_transmitted),
-                    f"{account_result.sync_duration_ms}ms"
-                )
-            
-            console.print(table)
+        for account_result in result.account_results:
+            status_color = "green" if account_result.status == "success" else "red"
+            table.add_row(
+                account_result.email,
+                f"[{status_color}]{account_result.status}[/{status_color}]",
+                str(account_result.emails_detected),
+                str(account_result.emails_transmitted),
+                f"{account_result.sync_duration_ms}ms"
+            )
         
-    except Exception as e:
-        console.print(f"[red]Error syncing accounts: {e}[/red]")
-        raise typer.Exit(1)
+        renderables.append(table)
+    
+    console.print(Group(*renderables))
 
 
 @multi_app.command("refresh-tokens")
+@_cli_safe("refreshing tokens")
 def refresh_tokens(
     hours_before_expiry: int = typer.Option(24, "--hours", "-h", help="Refresh tokens expiring within this many hours")
 ):
     """Refresh expiring tokens."""
-    try:
-        deps = get_dependencies()
-        multi_account_manager = create_multi_account_manager(deps)
-        
-        with console.status("[bold green]Refreshing tokens..."):
-            result = asyncio.run(multi_account_manager.refresh_expiring_tokens(
-                TokenRefreshRequest(hours_before_expiry=hours_before_expiry)
-            ))
-        
-        console.print(f"[green]🔐 Refreshed {result.tokens_refreshed} tokens[/green]")
-        console.print(f"❌ Failed {result.tokens_failed} tokens")
-        console.print(f"📊 Checked {result.accounts_checked} accounts")
+    deps = get_dependencies()
+    multi_account_manager = create_multi_account_manager(deps)
+    
+    with console.status("[bold green]Refreshing tokens..."):
+        result = _run_async(multi_account_manager.refresh_expiring_tokens(
+            TokenRefreshRequest(hours_before_expiry=hours_before_expiry)
+        ))
+    
+    renderables = [
+        f"[green]🔐 Refreshed {result.tokens_refreshed} tokens[/green]\n"
+        f"❌ Failed {result.tokens_failed} tokens\n"
+        f"📊 Checked {result.accounts_checked} accounts"
+    ]
+    
+    if result.refresh_results:
+        # Show refresh results table
+        table = Table(title="Token Refresh Results")
+        table.add_column("Email", style="cyan")
+        table.add_column("Status", style="green")
+        table.add_column("Error", style="red")
         
-        if result.refresh_results:
-            # Show refresh results table
-            table = Table(title="Token Refresh Results")
-            table.add_column("Email", style="cyan")
-            table.add_column("Status", style="green")
-            table.add_column("Error", style="red")
-            
-            for refresh_result in result.refresh_results:
-                status_color = "green" if refresh_result["status"] == "refreshed" else "red"
-                table.add_row(
-                    refresh_result["email"],
-                    f"[{status_color}]{refresh_result['status']}[/{status_color}]",
-                    refresh_result.get("error", "")
-                )
-            
-            console.print(table)
+        for refresh_result in result.refresh_results:
+            status_color = "green" if refresh_result["status"] == "refreshed" else "red"
+            table.add_row(
+                refresh_result["email"],
+                f"[{status_color}]{refresh_result['status']}[/{status_color}]",
+                refresh_result.get("error", "")
+            )
         
-    except Exception as e:
-        console.print(f"[red]Error refreshing tokens: {e}[/red]")
-        raise typer.Exit(1)
+        renderables.append(table)
+    
+    console.print(Group(*renderables))
 
 
 @multi_app.command("health-check")
+@_cli_safe("checking account health")
 def health_check():
     """Check health of all accounts."""
-    try:
-        deps = get_dependencies()
-        multi_account_manager = create_multi_account_manager(deps)
-        
-        with console.status("[bold green]Checking account health..."):
-            result = asyncio.run(multi_account_manager.check_accounts_health(
-                AccountHealthCheckRequest()
-            ))
-        
-        console.print(f"[green]✅ Healthy accounts: {result.healthy_accounts}[/green]")
-        console.print(f"[red]❌ Unhealthy accounts: {result.unhealthy_accounts}[/red]")
-        console.print(f"📊 Total accounts: {result.total_accounts}")
-        
-        # Create health status table
-        table = Table(title="Account Health Status")
-        table.add_column("Email", style="cyan")
-        table.add_column("Status", style="green")
-        table.add_column("Token Valid", style="yellow")
-        table.add_column("Last Sync", style="blue")
-        table.add_column("Issues", style="red")
-        
-        for status in result.account_statuses:
-            health_status = "✅ Healthy" if status.is_healthy else "❌ Unhealthy"
-            token_status = "✓" if status.token_valid else "✗"
-            last_sync = status.last_sync_at.strftime("%Y-%m-%d %H:%M") if status.last_sync_at else "Never"
-            issues = ", ".join(status.issues) if status.issues else "None"
-            
-            table.add_row(
-                status.email,
-                health_status,
-                token_status,
-                last_sync,
-                issues
-            )
-        
-        console.print(table)
-        
-    except Exception as e:
-        console.print(f"[red]Error checking account health: {e}[/red]")
-        raise typer.Exit(1)
+    deps = get_dependencies()
+    multi_account_manager = create_multi_account_manager(deps)
+    
+    with console.status("[bold green]Checking account health..."):
+        result = _run_async(multi_account_manager.check_accounts_health(
+            AccountHealthCheckRequest()
+        ))
+    
+    summary = (
+        f"[green]✅ Healthy accounts: {result.healthy_accounts}[/green]\n"
+        f"[red]❌ Unhealthy accounts: {result.unhealthy_accounts}[/red]\n"
+        f"📊 Total accounts: {result.total_accounts}"
+    )
+    
+    # Create health status table
+    table = Table(title="Account Health Status")
+    table.add_column("Email", style="cyan")
+    table.add_column("Status", style="green")
+    table.add_column("Token Valid", style="yellow")
+    table.add_column("Last Sync", style="blue")
+    table.add_column("Issues", style="red")
+    
+    for status in result.account_statuses:
+        health_status = "✅ Healthy" if status.is_healthy else "❌ Unhealthy"
+        token_status = "✓" if status.token_valid else "✗"
+        last_sync = _fmt_ts(status.last_sync_at)
+        issues = ", ".join(status.issues) if status.issues else "None"
+        
+        table.add_row(
+            status.email,
+            health_status,
+            token_status,
+            last_sync,
+            issues
+        )
+    
+    console.print(Group(summary, table))
 
 
 @multi_app.command("periodic-sync")
+@_cli_safe("running periodic sync")
 def periodic_sync(
     interval_minutes: int = typer.Option(5, "--interval", "-i", help="Sync interval in minutes"),
     max_duration_minutes: int = typer.Option(60, "--max-duration", "-d", help="Maximum duration in minutes")
 ):
     """Run periodic synchronization."""
-    try:
-        deps = get_dependencies()
-        multi_account_manager = create_multi_account_manager(deps)
-        
-        console.print(f"[blue]🔄 Starting periodic sync (interval: {interval_minutes}min, max duration: {max_duration_minutes}min)[/blue]")
-        
-        result = asyncio.run(multi_account_manager.schedule_periodic_sync(
-            interval_minutes=interval_minutes,
-            max_duration_minutes=max_duration_minutes
-        ))
-        
-        console.print(f"[green]✅ Periodic sync completed![/green]")
-        console.print(f"🔄 Sync cycles: {result['sync_count']}")
-        console.print(f"📧 Total emails detected: {result['total_emails_detected']}")
-        console.print(f"⏱️ Duration: {result['duration_minutes']} minutes")
-        
-    except Exception as e:
-        console.print(f"[red]Error running periodic sync: {e}[/red]")
-        raise typer.Exit(1)
+    deps = get_dependencies()
+    multi_account_manager = create_multi_account_manager(deps)
+    
+    console.print(f"[blue]🔄 Starting periodic sync (interval: {interval_minutes}min, max duration: {max_duration_minutes}min)[/blue]")
+    
+    result = _run_async(multi_account_manager.schedule_periodic_sync(
+        interval_minutes=interval_minutes,
+        max_duration_minutes=max_duration_minutes
+    ))
+    
+    console.print(
+        f"[green]✅ Periodic sync completed![/green]\n"
+        f"🔄 Sync cycles: {result['sync_count']}\n"
+        f"📧 Total emails detected: {result['total_emails_detected']}\n"
+        f"⏱️ Duration: {result['duration_minutes']} minutes"
+    )
 
 
 # Account management commands
 @account_app.command("list")
+@_cli_safe("listing accounts")
 def list_accounts(
     user_id: Optional[str] = typer.Option(None, "--user-id", "-u", help="Filter by user ID"),
     active_only: bool = typer.Option(False, "--active-only", "-a", help="Show only active accounts")
 ):
     """List all accounts or accounts for a specific user."""
-    try:
-        deps = get_dependencies()
-        account_usecase = deps['account_usecase']
-        
-        with console.status("[bold green]Fetching accounts..."):
-            if user_id:
-                result = asyncio.run(account_usecase.get_user_accounts(UUID(user_id)))
-                accounts = result.accounts
-            elif active_only:
-                result = asyncio.run(account_usecase.get_active_accounts())
-                accounts = result.accounts
-            else:
-                # Get all accounts (this would need to be implemented)
-                accounts = []
-        
-        if not accounts:
-            console.print("[yellow]No accounts found.[/yellow]")
-            return
-        
-        # Create table
-        table = Table(title="Accounts")
-        table.add_column("ID", style="cyan")
-        table.add_column("Email", style="green")
-        table.add_column("Display Name", style="blue")
-        table.add_column("Status", style="magenta")
-        table.add_column("Last Sync", style="yellow")
-        
-        for account in accounts:
-            status = "🟢 Active" if account.is_active and account.is_authorized else "🔴 Inactive"
-            last_sync = account.last_sync_at.strftime("%Y-%m-%d %H:%M") if account.last_sync_at else "Never"
-            
-            table.add_row(
-                str(account.id)[:8] + "...",
-                account.email,
-                account.display_name or "N/A",
-                status,
-                last_sync
-            )
-        
-        console.print(table)
-        
-    except Exception as e:
-        console.print(f"[red]Error listing accounts: {e}[/red]")
-        raise typer.Exit(1)
+    deps = get_dependencies()
+    account_usecase = deps['account_usecase']
+    
+    with console.status("[bold green]Fetching accounts..."):
+        if user_id:
+            result = _run_async(account_usecase.get_user_accounts(UUID(user_id)))
+            accounts = result.accounts
+        elif active_only:
+            result = _run_async(account_usecase.get_active_accounts())
+            accounts = result.accounts
+        else:
+            # Get all accounts (this would need to be implemented)
+            accounts = []
+    
+    if not accounts:
+        console.print("[yellow]No accounts found.[/yellow]")
+        return
+    
+    # Create table
+    table = Table(title="Accounts")
+    table.add_column("ID", style="cyan")
+    table.add_column("Email", style="green")
+    table.add_column("Display Name", style="blue")
+    table.add_column("Status", style="magenta")
+    table.add_column("Last Sync", style="yellow")
+    
+    for account in accounts:
+        status = "🟢 Active" if account.is_active and account.is_authorized else "🔴 Inactive"
+        last_sync = _fmt_ts(account.last_sync_at)
+        
+        table.add_row(
+            str(account.id)[:8] + "...",
+            account.email,
+            account.display_name or "N/A",
+            status,
+            last_sync
+        )
+    
+    console.print(table)
 
 
 @account_app.command("add")
+@_cli_safe("adding account")
 def add_account(
     username: str = typer.Option(..., "--username", "-u", help="Username for the account"),
     email: str = typer.Option(..., "--email", "-e", help="Email address"),
     display_name: Optional[str] = typer.Option(None, "--display-name", "-d", help="Display name")
 ):
     """Add a new account."""
-    try:
-        deps = get_dependencies()
-        account_usecase = deps['account_usecase']
-        
-        with console.status("[bold green]Adding account..."):
-            result = asyncio.run(account_usecase.create_account(
-                username=username,
-                email=email,
-                display_name=display_name
-            ))
-        
-        if result.success:
-            console.print(f"[green]✓ Account added successfully![/green]")
-            console.print(f"Account ID: {result.account.id}")
-            console.print(f"Email: {result.account.email}")
-        else:
-            console.print(f"[red]✗ Failed to add account: {result.error}[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error adding account: {e}[/red]")
+    deps = get_dependencies()
+    account_usecase = deps['account_usecase']
+    
+    with console.status("[bold green]Adding account..."):
+        result = _run_async(account_usecase.create_account(
+            username=username,
+            email=email,
+            display_name=display_name
+        ))
+    
+    if result.success:
+        console.print(
+            f"[green]✓ Account added successfully![/green]\n"
+            f"Account ID: {result.account.id}\n"
+            f"Email: {result.account.email}"
+        )
+    else:
+        console.print(f"[red]✗ Failed to add account: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 @account_app.command("authorize")
+@_cli_safe("authorizing account")
 def authorize_account(
     account_id: str = typer.Argument(..., help="Account ID to authorize"),
     authorization_code: Optional[str] = typer.Option(None, "--code", "-c", help="Authorization code from OAuth flow")
 ):
     """Authorize an account with Microsoft Graph API."""
-    try:
-        deps = get_dependencies()
-        account_usecase = deps['account_usecase']
-        
-        if not authorization_code:
-            # Get authorization URL
-            with console.status("[bold blue]Getting authorization URL..."):
-                auth_result = asyncio.run(account_usecase.get_authorization_url(UUID(account_id)))
-            
-            if auth_result.success:
-                console.print(Panel(
-                    f"Please visit this URL to authorize the account:\n\n{auth_result.authorization_url}",
-                    title="Authorization Required",
-                    border_style="blue"
-                ))
-                authorization_code = typer.prompt("Enter the authorization code")
-            else:
-                console.print(f"[red]✗ Failed to get authorization URL: {auth_result.error}[/red]")
-                raise typer.Exit(1)
+    deps = get_dependencies()
+    account_usecase = deps['account_usecase']
+    
+    if not authorization_code:
+        # Get authorization URL
+        with console.status("[bold blue]Getting authorization URL..."):
+            auth_result = _run_async(account_usecase.get_authorization_url(UUID(account_id)))
         
-        # Exchange code for token
-        with console.status("[bold green]Exchanging authorization code..."):
-            result = asyncio.run(account_usecase.authorize_account(
-                UUID(account_id), 
-                authorization_code
+        if auth_result.success:
+            console.print(Panel(
+                f"Please visit this URL to authorize the account:\n\n{auth_result.authorization_url}",
+                title="Authorization Required",
+                border_style="blue"
             ))
-        
-        if result.success:
-            console.print(f"[green]✓ Account authorized successfully![/green]")
-            console.print(f"Account: {result.account.email}")
-            console.print(f"Status: {'Authorized' if result.account.is_authorized else 'Not Authorized'}")
+            authorization_code = typer.prompt("Enter the authorization code")
         else:
-            console.print(f"[red]✗ Authorization failed: {result.error}[/red]")
+            console.print(f"[red]✗ Failed to get authorization URL: {auth_result.error}[/red]")
             raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error authorizing account: {e}[/red]")
+    
+    # Exchange code for token
+    with console.status("[bold green]Exchanging authorization code..."):
+        result = _run_async(account_usecase.authorize_account(
+            UUID(account_id), 
+            authorization_code
+        ))
+    
+    if result.success:
+        console.print(
+            f"[green]✓ Account authorized successfully![/green]\n"
+            f"Account: {result.account.email}\n"
+            f"Status: {'Authorized' if result.account.is_authorized else 'Not Authorized'}"
+        )
+    else:
+        console.print(f"[red]✗ Authorization failed: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 @account_app.command("remove")
+@_cli_safe("removing account")
 def remove_account(
     account_id: str = typer.Argument(..., help="Account ID to remove"),
     force: bool = typer.Option(False, "--force", "-f", help="Force removal without confirmation")
 ):
     """Remove an account."""
-    try:
-        deps = get_dependencies()
-        account_usecase = deps['account_usecase']
-        
-        if not force:
-            confirm = typer.confirm(f"Are you sure you want to remove account {account_id}?")
-            if not confirm:
-                console.print("[yellow]Operation cancelled.[/yellow]")
-                return
-        
-        with console.status("[bold red]Removing account..."):
-            result = asyncio.run(account_usecase.remove_account(UUID(account_id)))
-        
-        if result.success:
-            console.print(f"[green]✓ Account removed successfully![/green]")
-        else:
-            console.print(f"[red]✗ Failed to remove account: {result.error}[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error removing account: {e}[/red]")
+    deps = get_dependencies()
+    account_usecase = deps['account_usecase']
+    
+    if not force:
+        confirm = typer.confirm(f"Are you sure you want to remove account {account_id}?")
+        if not confirm:
+            console.print("[yellow]Operation cancelled.[/yellow]")
+            return
+    
+    with console.status("[bold red]Removing account..."):
+        result = _run_async(account_usecase.remove_account(UUID(account_id)))
+    
+    if result.success:
+        console.print(f"[green]✓ Account removed successfully![/green]")
+    else:
+        console.print(f"[red]✗ Failed to remove account: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 # Email management commands
 @email_app.command("detect")
+@_cli_safe("detecting emails")
 def detect_emails(
     account_id: Optional[str] = typer.Option(None, "--account-id", "-a", help="Specific account ID"),
     limit: int = typer.Option(100, "--limit", "-l", help="Maximum number of emails to detect"),
     use_delta: bool = typer.Option(True, "--use-delta/--no-delta", help="Use delta query for incremental sync")
 ):
     """Detect new emails from Microsoft Graph API."""
-    try:
-        deps = get_dependencies()
-        email_usecase = deps['email_usecase']
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Detecting emails...", total=None)
+    deps = get_dependencies()
+    email_usecase = deps['email_usecase']
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Detecting emails...", total=None)
+        
+        if account_id:
+            result = _run_async(email_usecase.detect_emails_for_account(
+                UUID(account_id), 
+                limit=limit,
+                use_delta=use_delta
+            ))
+        else:
+            result = _run_async(email_usecase.detect_emails_for_all_accounts(
+                limit=limit,
+                use_delta=use_delta
+            ))
+    
+    if result.success:
+        renderables = [
+            f"[green]✓ Email detection completed![/green]\n"
+            f"Emails detected: {len(result.emails)}\n"
+            f"New emails: {result.new_count}\n"
+            f"Updated emails: {result.updated_count}"
+        ]
+        
+        if result.emails:
+            # Show summary table
+            table = Table(title="Detected Emails")
+            table.add_column("Subject", style="cyan", max_width=50)
+            table.add_column("Sender", style="green")
+            table.add_column("Received", style="yellow")
+            table.add_column("Status", style="magenta")
             
-            if account_id:
-                result = asyncio.run(email_usecase.detect_emails_for_account(
-                    UUID(account_id), 
-                    limit=limit,
-                    use_delta=use_delta
-                ))
-            else:
-                result = asyncio.run(email_usecase.detect_emails_for_all_accounts(
-                    limit=limit,
-                    use_delta=use_delta
-                ))
-        
-        if result.success:
-            console.print(f"[green]✓ Email detection completed![/green]")
-            console.print(f"Emails detected: {len(result.emails)}")
-            console.print(f"New emails: {result.new_count}")
-            console.print(f"Updated emails: {result.updated_count}")
+            for email in result.emails[:10]:  # Show first 10
+                received = _fmt_short_ts(email.received_at)
+                table.add_row(
+                    email.subject[:47] + "..." if len(email.subject) > 50 else email.subject,
+                    email.sender,
+                    received,
+                    email.processing_status
+                )
             
-            if result.emails:
-                # Show summary table
-                table = Table(title="Detected Emails")
-                table.add_column("Subject", style="cyan", max_width=50)
-                table.add_column("Sender", style="green")
-                table.add_column("Received", style="yellow")
-                table.add_column("Status", style="magenta")
-                
-                for email in result.emails[:10]:  # Show first 10
-                    received = email.received_at.strftime("%m-%d %H:%M") if email.received_at else "N/A"
-                    table.add_row(
-                        email.subject[:47] + "..." if len(email.subject) > 50 else email.subject,
-                        email.sender,
-                        received,
-                        email.processing_status
-                    )
-                
-                console.print(table)
-                
-                if len(result.emails) > 10:
-                    console.print(f"[dim]... and {len(result.emails) - 10} more emails[/dim]")
-        else:
-            console.print(f"[red]✗ Email detection failed: {result.error}[/red]")
-            raise typer.Exit(1)
+            renderables.append(table)
             
-    except Exception as e:
-        console.print(f"[red]Error detecting emails: {e}[/red]")
+            if len(result.emails) > 10:
+                renderables.append(f"[dim]... and {len(result.emails) - 10} more emails[/dim]")
+        
+        console.print(Group(*renderables))
+    else:
+        console.print(f"[red]✗ Email detection failed: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 @email_app.command("list")
+@_cli_safe("listing emails")
 def list_emails(
     account_id: Optional[str] = typer.Option(None, "--account-id", "-a", help="Filter by account ID"),
     status: Optional[str] = typer.Option(None, "--status", "-s", help="Filter by processing status"),
     limit: int = typer.Option(20, "--limit", "-l", help="Maximum number of emails to show")
 ):
     """List emails in the database."""
-    try:
-        deps = get_dependencies()
-        email_usecase = deps['email_usecase']
-        
-        with console.status("[bold green]Fetching emails..."):
-            if account_id:
-                result = asyncio.run(email_usecase.get_emails_by_account(
-                    UUID(account_id), 
-                    limit=limit
-                ))
-                emails = result.emails
-            elif status:
-                result = asyncio.run(email_usecase.get_emails_by_status(
-                    status, 
-                    limit=limit
-                ))
-                emails = result.emails
-            else:
-                # Get recent emails (this would need to be implemented)
-                emails = []
-        
-        if not emails:
-            console.print("[yellow]No emails found.[/yellow]")
-            return
-        
-        # Create table
-        table = Table(title=f"Emails ({len(emails)} found)")
-        table.add_column("ID", style="cyan")
-        table.add_column("Subject", style="green", max_width=40)
-        table.add_column("Sender", style="blue", max_width=30)
-        table.add_column("Received", style="yellow")
-        table.add_column("Status", style="magenta")
-        
-        for email in emails:
-            received = email.received_at.strftime("%m-%d %H:%M") if email.received_at else "N/A"
-            subject = email.subject[:37] + "..." if len(email.subject) > 40 else email.subject
-            
-            table.add_row(
-                str(email.id)[:8] + "...",
-                subject,
-                email.sender[:27] + "..." if len(email.sender) > 30 else email.sender,
-                received,
-                email.processing_status
-            )
-        
-        console.print(table)
-        
-    except Exception as e:
-        console.print(f"[red]Error listing emails: {e}[/red]")
-        raise typer.Exit(1)
+    deps = get_dependencies()
+    email_usecase = deps['email_usecase']
+    
+    with console.status("[bold green]Fetching emails..."):
+        if account_id:
+            result = _run_async(email_usecase.get_emails_by_account(
+                UUID(account_id), 
+                limit=limit
+            ))
+            emails = result.emails
+        elif status:
+            result = _run_async(email_usecase.get_emails_by_status(
+                status, 
+                limit=limit
+            ))
+            emails = result.emails
+        else:
+            # Get recent emails (this would need to be implemented)
+            emails = []
+    
+    if not emails:
+        console.print("[yellow]No emails found.[/yellow]")
+        return
+    
+    # Create table
+    table = Table(title=f"Emails ({len(emails)} found)")
+    table.add_column("ID", style="cyan")
+    table.add_column("Subject", style="green", max_width=40)
+    table.add_column("Sender", style="blue", max_width=30)
+    table.add_column("Received", style="yellow")
+    table.add_column("Status", style="magenta")
+    
+    for email in emails:
+        received = _fmt_short_ts(email.received_at)
+        subject = email.subject[:37] + "..." if len(email.subject) > 40 else email.subject
+        
+        table.add_row(
+            str(email.id)[:8] + "...",
+            subject,
+            email.sender[:27] + "..." if len(email.sender) > 30 else email.sender,
+            received,
+            email.processing_status
+        )
+    
+    console.print(table)
 
 
 # Transmission commands
 @transmission_app.command("send")
+@_cli_safe("sending emails")
 def send_emails(
     status: str = typer.Option("pending", "--status", "-s", help="Email status to send"),
     limit: int = typer.Option(50, "--limit", "-l", help="Maximum number of emails to send"),
     endpoint: Optional[str] = typer.Option(None, "--endpoint", "-e", help="Specific API endpoint")
 ):
     """Send emails to external API."""
-    try:
-        deps = get_dependencies()
-        transmission_usecase = deps['transmission_usecase']
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Sending emails...", total=None)
-            
-            result = asyncio.run(transmission_usecase.transmit_pending_emails(
-                limit=limit,
-                endpoint=endpoint
-            ))
-        
-        if result.success:
-            console.print(f"[green]✓ Email transmission completed![/green]")
-            console.print(f"Total processed: {result.total_processed}")
-            console.print(f"Successful: {result.successful_count}")
-            console.print(f"Failed: {result.failed_count}")
+    deps = get_dependencies()
+    transmission_usecase = deps['transmission_usecase']
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Sending emails...", total=None)
+        
+        result = _run_async(transmission_usecase.transmit_pending_emails(
+            limit=limit,
+            endpoint=endpoint
+        ))
+    
+    if result.success:
+        renderables = [
+            f"[green]✓ Email transmission completed![/green]\n"
+            f"Total processed: {result.total_processed}\n"
+            f"Successful: {result.successful_count}\n"
+            f"Failed: {result.failed_count}"
+        ]
+        
+        if result.transmission_records:
+            # Show summary table
+            table = Table(title="Transmission Results")
+            table.add_column("Email ID", style="cyan")
+            table.add_column("Status", style="green")
+            table.add_column("Response Code", style="yellow")
+            table.add_column("Processing Time", style="magenta")
             
-            if result.transmission_records:
-                # Show summary table
-                table = Table(title="Transmission Results")
-                table.add_column("Email ID", style="cyan")
-                table.add_column("Status", style="green")
-                table.add_column("Response Code", style="yellow")
-                table.add_column("Processing Time", style="magenta")
-                
-                for record in result.transmission_records[:10]:  # Show first 10
-                    status_color = "green" if record.status == "success" else "red"
-                    table.add_row(
-                        str(record.email_id)[:8] + "...",
-                        f"[{status_color}]{record.status}[/{status_color}]",
-                        str(record.response_status_code) if record.response_status_code else "N/A",
-                        f"{record.processing_time_ms}ms" if record.processing_time_ms else "N/A"
-                    )
-                
-                console.print(table)
-        else:
-            console.print(f"[red]✗ Email transmission failed: {result.error}[/red]")
-            raise typer.Exit(1)
+            for record in result.transmission_records[:10]:  # Show first 10
+                status_color = "green" if record.status == "success" else "red"
+                table.add_row(
+                    str(record.email_id)[:8] + "...",
+                    f"[{status_color}]{record.status}[/{status_color}]",
+                    str(record.response_status_code) if record.response_status_code else "N/A",
+                    f"{record.processing_time_ms}ms" if record.processing_time_ms else "N/A"
+                )
             
-    except Exception as e:
-        console.print(f"[red]Error sending emails: {e}[/red]")
+            renderables.append(table)
+        
+        console.print(Group(*renderables))
+    else:
+        console.print(f"[red]✗ Email transmission failed: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 @transmission_app.command("retry")
+@_cli_safe("retrying transmissions")
 def retry_failed_transmissions(
     limit: int = typer.Option(20, "--limit", "-l", help="Maximum number of retries")
 ):
     """Retry failed transmissions."""
-    try:
-        deps = get_dependencies()
-        transmission_usecase = deps['transmission_usecase']
-        
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console
-        ) as progress:
-            task = progress.add_task("Retrying failed transmissions...", total=None)
-            
-            result = asyncio.run(transmission_usecase.retry_failed_transmissions(limit=limit))
-        
-        if result.success:
-            console.print(f"[green]✓ Retry completed![/green]")
-            console.print(f"Retried: {result.total_processed}")
-            console.print(f"Successful: {result.successful_count}")
-            console.print(f"Still failed: {result.failed_count}")
-        else:
-            console.print(f"[red]✗ Retry failed: {result.error}[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error retrying transmissions: {e}[/red]")
+    deps = get_dependencies()
+    transmission_usecase = deps['transmission_usecase']
+    
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console
+    ) as progress:
+        task = progress.add_task("Retrying failed transmissions...", total=None)
+        
+        result = _run_async(transmission_usecase.retry_failed_transmissions(limit=limit))
+    
+    if result.success:
+        console.print(
+            f"[green]✓ Retry completed![/green]\n"
+            f"Retried: {result.total_processed}\n"
+            f"Successful: {result.successful_count}\n"
+            f"Still failed: {result.failed_count}"
+        )
+    else:
+        console.print(f"[red]✗ Retry failed: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 @transmission_app.command("status")
+@_cli_safe("getting transmission status")
 def transmission_status():
     """Show transmission status summary."""
-    try:
-        deps = get_dependencies()
-        transmission_usecase = deps['transmission_usecase']
-        
-        with console.status("[bold green]Getting transmission status..."):
-            result = asyncio.run(transmission_usecase.get_transmission_summary())
+    deps = get_dependencies()
+    transmission_usecase = deps['transmission_usecase']
+    
+    with console.status("[bold green]Getting transmission status..."):
+        result = _run_async(transmission_usecase.get_transmission_summary())
+    
+    if result.success:
+        summary = result.summary
         
-        if result.success:
-            summary = result.summary
-            
-            # Create status panel
-            status_text = f"""
+        # Create status panel
+        status_text = f"""
 [green]✓ Successful:[/green] {summary.get('successful', 0)}
 [yellow]⏳ Pending:[/yellow] {summary.get('pending', 0)}
 [blue]🔄 Processing:[/blue] {summary.get('processing', 0)}
@@ -692,131 +731,117 @@ def transmission_status():
 [orange]🔁 Retry:[/orange] {summary.get('retry', 0)}
 
 [bold]Total Records:[/bold] {summary.get('total', 0)}
-            """
-            
-            console.print(Panel(
-                status_text.strip(),
-                title="Transmission Status",
-                border_style="blue"
-            ))
-        else:
-            console.print(f"[red]✗ Failed to get status: {result.error}[/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error getting transmission status: {e}[/red]")
+        """
+        
+        console.print(Panel(
+            status_text.strip(),
+            title="Transmission Status",
+            border_style="blue"
+        ))
+    else:
+        console.print(f"[red]✗ Failed to get status: {result.error}[/red]")
         raise typer.Exit(1)
 
 
 # Database management commands
 @db_app.command("migrate")
+@_cli_safe("running migration")
 def migrate_database(
     drop_existing: bool = typer.Option(False, "--drop-existing", help="Drop existing tables first")
 ):
     """Run database migrations."""
-    try:
-        config = ConfigAdapter(get_config())
-        
-        with console.status("[bold green]Running database migration..."):
-            migrate_database_sync(config, drop_existing=drop_existing)
-        
-        console.print("[green]✓ Database migration completed successfully![/green]")
-        
-    except Exception as e:
-        console.print(f"[red]Error running migration: {e}[/red]")
-        raise typer.Exit(1)
+    config = get_cli_config()
+    
+    with console.status("[bold green]Running database migration..."):
+        migrate_database_sync(config, drop_existing=drop_existing)
+    
+    console.print("[green]✓ Database migration completed successfully![/green]")
 
 
 @db_app.command("health")
+@_cli_safe("checking database health")
 def database_health():
     """Check database health."""
-    try:
-        deps = get_dependencies()
-        db_adapter = deps['db_adapter']
-        
-        with console.status("[bold green]Checking database health..."):
-            is_healthy = db_adapter.sync_health_check()
-        
-        if is_healthy:
-            console.print("[green]✓ Database is healthy![/green]")
-        else:
-            console.print("[red]✗ Database health check failed![/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error checking database health: {e}[/red]")
+    deps = get_dependencies()
+    db_adapter = deps['db_adapter']
+    
+    with console.status("[bold green]Checking database health..."):
+        is_healthy = db_adapter.sync_health_check()
+    
+    if is_healthy:
+        console.print("[green]✓ Database is healthy![/green]")
+    else:
+        console.print("[red]✗ Database health check failed![/red]")
         raise typer.Exit(1)
 
 
 # Configuration commands
 @config_app.command("show")
+@_cli_safe("showing configuration")
 def show_config():
     """Show current configuration (with sensitive data masked)."""
-    try:
-        config = ConfigAdapter(get_config())
-        
-        config_info = {
-            "Environment": config.get_environment(),
-            "Database URL": config.get_database_url().split('@')[-1] if '@' in config.get_database_url() else config.get_database_url(),
-            "Graph API Endpoint": config.get_graph_api_endpoint(),
-            "External API URL": config.get_external_api_url(),
-            "Client ID": config.get_client_id()[:8] + "..." if config.get_client_id() else "Not set",
-            "Client Secret": "Set" if config.get_client_secret() else "Not set",
-            "External API Key": "Set" if config.get_external_api_key() else "Not set"
-        }
-        
-        # Create configuration table
-        table = Table(title="Configuration")
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="green")
-        
-        for key, value in config_info.items():
-            table.add_row(key, str(value))
-        
-        console.print(table)
-        
-    except Exception as e:
-        console.print(f"[red]Error showing configuration: {e}[/red]")
-        raise typer.Exit(1)
+    config = get_cli_config()
+    
+    config_info = {
+        "Environment": config.get_environment(),
+        "Database URL": config.get_database_url().split('@')[-1] if '@' in config.get_database_url() else config.get_database_url(),
+        "Graph API Endpoint": config.get_graph_api_endpoint(),
+        "External API URL": config.get_external_api_url(),
+        "Client ID": config.get_client_id()[:8] + "..." if config.get_client_id() else "Not set",
+        "Client Secret": "Set" if config.get_client_secret() else "Not set",
+        "External API Key": "Set" if config.get_external_api_key() else "Not set"
+    }
+    
+    # Create configuration table
+    table = Table(title="Configuration")
+    table.add_column("Setting", style="cyan")
+    table.add_column("Value", style="green")
+    
+    for key, value in config_info.items():
+        table.add_row(key, str(value))
+    
+    console.print(table)
 
 
 @config_app.command("test")
+@_cli_safe("testing connections")
 def test_connections():
     """Test connections to external services."""
-    try:
-        deps = get_dependencies()
-        graph_api = deps['graph_api']
-        external_api = deps['external_api']
-        
-        console.print("[bold blue]Testing connections...[/bold blue]")
-        
-        # Test Graph API
-        with console.status("[bold green]Testing Graph API..."):
-            graph_healthy = asyncio.run(graph_api.health_check())
-        
-        if graph_healthy:
-            console.print("[green]✓ Graph API connection: OK[/green]")
-        else:
-            console.print("[red]✗ Graph API connection: FAILED[/red]")
-        
-        # Test External API
-        with console.status("[bold green]Testing External API..."):
-            external_healthy = asyncio.run(external_api.health_check())
-        
-        if external_healthy:
-            console.print("[green]✓ External API connection: OK[/green]")
-        else:
-            console.print("[red]✗ External API connection: FAILED[/red]")
-        
-        # Overall status
-        if graph_healthy and external_healthy:
-            console.print("\n[green]✓ All connections are healthy![/green]")
-        else:
-            console.print("\n[red]✗ Some connections failed![/red]")
-            raise typer.Exit(1)
-            
-    except Exception as e:
-        console.print(f"[red]Error testing connections: {e}[/red]")
+    deps = get_dependencies()
+    graph_api = deps['graph_api']
+    external_api = deps['external_api']
+    
+    async def _run_health_checks():
+        return await asyncio.gather(
+            graph_api.health_check(),
+            external_api.health_check(),
+            return_exceptions=True
+        )
+    
+    # Test Graph API and External API concurrently in a single event loop
+    with console.status("[bold green]Testing Graph API and External API..."):
+        graph_result, external_result = _run_async(_run_health_checks())
+    
+    graph_healthy = graph_result is True
+    external_healthy = external_result is True
+    all_healthy = graph_healthy and external_healthy
+    
+    # Create connection status table
+    table = Table(title="Connection Status")
+    table.add_column("Service", style="cyan")
+    table.add_column("Status")
+    
+    table.add_row("Graph API", "[green]✓ OK[/green]" if graph_healthy else "[red]✗ FAILED[/red]")
+    table.add_row("External API", "[green]✓ OK[/green]" if external_healthy else "[red]✗ FAILED[/red]")
+    table.add_section()
+    table.add_row(
+        "[bold]Overall[/bold]",
+        "[green]✓ All connections are healthy![/green]" if all_healthy else "[red]✗ Some connections failed![/red]"
+    )
+    
+    console.print(table)
+    
+    if not all_healthy:
         raise typer.Exit(1)
 
 
@@ -1,9 +1,16 @@
 """
 HTTP 관련 공통 유틸리티
 """
+import asyncio
+import importlib.util
 import json
+import logging
+import random
+import weakref
 import httpx
-from typing import Dict, Any, Optional, Type, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Type, Union
 from core.exceptions import (
     ExternalServiceError, 
     AuthenticationError, 
@@ -12,10 +19,78 @@ from core.exceptions import (
     ValidationError
 )
 
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성 - 없으면 표준 json 사용
+    orjson = None
+
+# HTTP/2 는 h2 패키지(httpx[http2])가 설치된 경우에만 활성화
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 루프별 공유 AsyncClient (get_shared_client 에서 지연 생성)
+# CLI 는 명령마다 asyncio.run 으로 새 루프를 만들므로 루프가 사라지면 항목도 사라진다
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[httpx.AsyncClient, httpx.Limits]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _json_dumps(data: Any) -> str:
+    """JSON 직렬화 (orjson 사용 가능 시 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+
+def _json_loads(content: Union[bytes, str]) -> Any:
+    """JSON 역직렬화 (orjson.JSONDecodeError 는 json.JSONDecodeError 의 하위 클래스)"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
 
 class HTTPErrorHandler:
     """HTTP 응답 에러 처리 유틸리티"""
     
+    @staticmethod
+    def _raise_bad_request(response, service_name, error_message, auth_error_class, rate_limit_error_class):
+        """400 Bad Request 예외 발생"""
+        raise ValidationError(f"Bad request to {service_name}: {error_message}")
+    
+    @staticmethod
+    def _raise_unauthorized(response, service_name, error_message, auth_error_class, rate_limit_error_class):
+        """401 Unauthorized 예외 발생"""
+        raise auth_error_class(f"Authentication failed: {error_message}", service=service_name)
+    
+    @staticmethod
+    def _raise_forbidden(response, service_name, error_message, auth_error_class, rate_limit_error_class):
+        """403 Forbidden 예외 발생"""
+        raise AuthorizationError(f"Access forbidden: {error_message}", service=service_name)
+    
+    @staticmethod
+    def _raise_rate_limited(response, service_name, error_message, auth_error_class, rate_limit_error_class):
+        """429 Too Many Requests 예외 발생"""
+        raw_retry_after = response.headers.get("Retry-After")
+        try:
+            retry_after = int(raw_retry_after) if raw_retry_after else 60
+        except ValueError:
+            retry_after = 60
+        raise rate_limit_error_class(
+            f"Rate limit exceeded for {service_name}. Retry after {retry_after} seconds",
+            service=service_name,
+            retry_after=retry_after
+        )
+    
+    # 상태 코드별 예외 처리 디스패치 테이블 (5xx 는 범위 검사로 별도 처리)
+    _HANDLERS = {
+        400: _raise_bad_request,
+        401: _raise_unauthorized,
+        403: _raise_forbidden,
+        429: _raise_rate_limited,
+    }
+    
     @staticmethod
     async def handle_response_errors(
         response: httpx.Response,
@@ -24,44 +99,35 @@ class HTTPErrorHandler:
         rate_limit_error_class: Type[Exception] = RateLimitError
     ) -> None:
         """HTTP 응답 에러 처리"""
-        if response.status_code < 400:
+        status_code = response.status_code
+        if status_code < 400:
             return
         
         # 에러 메시지 추출
         error_message, error_code = HTTPErrorHandler._extract_error_info(response)
         
         # 상태 코드별 예외 처리
-        if response.status_code == 401:
-            raise auth_error_class(f"Authentication failed: {error_message}", service=service_name)
-        elif response.status_code == 403:
-            raise AuthorizationError(f"Access forbidden: {error_message}", service=service_name)
-        elif response.status_code == 429:
-            retry_after = response.headers.get("Retry-After", "60")
-            raise rate_limit_error_class(
-                f"Rate limit exceeded for {service_name}. Retry after {retry_after} seconds",
-                service=service_name,
-                retry_after=int(retry_after)
-            )
-        elif response.status_code >= 500:
+        handler = HTTPErrorHandler._HANDLERS.get(status_code)
+        if handler is not None:
+            handler(response, service_name, error_message, auth_error_class, rate_limit_error_class)
+        elif status_code >= 500:
             raise ExternalServiceError(
                 f"{service_name} server error: {error_message}",
                 service=service_name,
-                status_code=response.status_code
+                status_code=status_code
             )
-        elif response.status_code == 400:
-            raise ValidationError(f"Bad request to {service_name}: {error_message}")
         else:
             raise ExternalServiceError(
-                f"{service_name} error ({response.status_code}): {error_message}",
+                f"{service_name} error ({status_code}): {error_message}",
                 service=service_name,
-                status_code=response.status_code
+                status_code=status_code
             )
     
     @staticmethod
     def _extract_error_info(response: httpx.Response) -> tuple[str, Optional[str]]:
         """응답에서 에러 정보 추출"""
         try:
-            error_data = response.json()
+            error_data = _json_loads(response.content)
             if isinstance(error_data, dict):
                 # Graph API 스타일
                 if "error" in error_data and isinstance(error_data["error"], dict):
@@ -75,41 +141,97 @@ class HTTPErrorHandler:
                 message = str(error_data)
                 code = f"HTTP{response.status_code}"
         except json.JSONDecodeError:
-            message = f"HTTP {response.status_code}: {response.text[:200]}"
+            # 본문 전체를 디코딩하지 않도록 앞부분 바이트만 디코딩
+            snippet = response.content[:512].decode("utf-8", errors="replace")[:200]
+            message = f"HTTP {response.status_code}: {snippet}"
             code = f"HTTP{response.status_code}"
         
         return message, code
 
 
+@lru_cache(maxsize=64)
+def _default_headers_cached(service_name: str, version: str) -> Mapping[str, str]:
+    """서비스/버전별 기본 헤더를 한 번만 생성하여 읽기 전용으로 캐싱"""
+    return MappingProxyType({
+        "User-Agent": f"GraphAPIQuery/{version} ({service_name})",
+        "Accept": "application/json",
+        "Content-Type": "application/json"
+    })
+
+
 class HTTPClientUtils:
     """HTTP 클라이언트 관련 유틸리티"""
     
     @staticmethod
     def get_default_headers(service_name: str, version: str = "1.0") -> Dict[str, str]:
-        """기본 HTTP 헤더 생성"""
-        return {
-            "User-Agent": f"GraphAPIQuery/{version} ({service_name})",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        """기본 HTTP 헤더 생성 (수정 가능한 복사본)"""
+        return dict(_default_headers_cached(service_name, version))
+    
+    @staticmethod
+    def get_default_headers_view(service_name: str, version: str = "1.0") -> Mapping[str, str]:
+        """기본 HTTP 헤더의 캐싱된 읽기 전용 뷰"""
+        return _default_headers_cached(service_name, version)
+    
+    @staticmethod
+    def get_shared_client(limits: httpx.Limits) -> httpx.AsyncClient:
+        """현재 이벤트 루프의 공유 AsyncClient 반환 (최초 호출 시 생성, 가능하면 HTTP/2 사용)
+        
+        같은 origin 으로의 요청이 TCP/TLS 연결을 재사용하도록 일회성 클라이언트 대신 사용한다.
+        기본 헤더가 없으므로 호출자가 요청마다 headers 를 넘긴다.
+        limits 는 설정값(ConfigPort.get_httpx_limits)을 넘기며, 클라이언트가 생성될 때만
+        적용되고 이후 다른 값이 오면 경고만 남긴다.
+        """
+        loop = asyncio.get_running_loop()
+        entry = _shared_clients.get(loop)
+        if entry is None or entry[0].is_closed:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=limits,
+                timeout=httpx.Timeout(10.0)
+            )
+            _shared_clients[loop] = (client, limits)
+            return client
+        
+        client, created_limits = entry
+        if limits != created_limits:
+            logger.warning(
+                "공유 AsyncClient 가 이미 %r 로 생성되어 있어 %r 는 무시됩니다",
+                created_limits, limits
+            )
+        return client
     
     @staticmethod
-    def add_auth_header(headers: Dict[str, str], token: str, auth_type: str = "Bearer") -> Dict[str, str]:
-        """인증 헤더 추가"""
-        headers = headers.copy()
-        headers["Authorization"] = f"{auth_type} {token}"
-        return headers
+    async def close_shared_client() -> None:
+        """현재 이벤트 루프의 공유 AsyncClient 종료"""
+        entry = _shared_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[0].aclose()
+    
+    @staticmethod
+    def add_auth_header(
+        headers: Dict[str, str],
+        token: str,
+        auth_type: str = "Bearer",
+        *,
+        inplace: bool = False
+    ) -> Dict[str, str]:
+        """인증 헤더 추가 (inplace=True 이면 전달된 dict를 직접 수정)"""
+        if inplace:
+            headers["Authorization"] = f"{auth_type} {token}"
+            return headers
+        return {**headers, "Authorization": f"{auth_type} {token}"}
     
     @staticmethod
     def prepare_json_payload(data: Dict[str, Any]) -> str:
         """JSON 페이로드 준비"""
-        return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+        return _json_dumps(data)
     
     @staticmethod
     def is_json_response(response: httpx.Response) -> bool:
         """응답이 JSON 형식인지 확인"""
+        # 미디어 타입은 항상 헤더 앞부분에 오므로 고정 길이 접두사만 비교
         content_type = response.headers.get("content-type", "")
-        return "application/json" in content_type.lower()
+        return content_type[:16].lower() == "application/json"
     
     @staticmethod
     def safe_json_decode(response: httpx.Response) -> Optional[Dict[str, Any]]:
@@ -118,11 +240,15 @@ class HTTPClientUtils:
             return None
         
         try:
-            return response.json()
+            return _json_loads(response.content)
         except json.JSONDecodeError:
             return None
 
 
+# 5xx 외에 재시도 대상인 상태 코드 (429 Rate Limit, 408 Request Timeout)
+_RETRYABLE_STATUS_CODES = frozenset((408, 429))
+
+
 class RetryUtils:
     """재시도 관련 유틸리티"""
     
@@ -132,23 +258,18 @@ class RetryUtils:
         if attempt >= max_retries:
             return False
         
-        # 5xx 서버 에러는 재시도
-        if response.status_code >= 500:
-            return True
-        
-        # 429 Rate Limit은 재시도
-        if response.status_code == 429:
-            return True
-        
-        # 408 Request Timeout은 재시도
-        if response.status_code == 408:
-            return True
-        
-        return False
+        # 5xx 서버 에러, 429 Rate Limit, 408 Request Timeout 은 재시도
+        status_code = response.status_code
+        return status_code >= 500 or status_code in _RETRYABLE_STATUS_CODES
     
     @staticmethod
-    def get_retry_delay(response: httpx.Response, attempt: int, base_delay: float = 1.0) -> float:
-        """재시도 지연 시간 계산"""
+    def get_retry_delay(
+        response: httpx.Response,
+        attempt: int,
+        base_delay: float = 1.0,
+        max_delay: Optional[float] = None
+    ) -> float:
+        """재시도 지연 시간 계산 (Retry-After 우선, 없으면 full jitter 지수 백오프)"""
         # Retry-After 헤더가 있으면 사용
         retry_after = response.headers.get("Retry-After")
         if retry_after:
@@ -157,5 +278,8 @@ class RetryUtils:
             except ValueError:
                 pass
         
-        # 지수 백오프 적용
-        return base_delay * (2 ** attempt)
+        # 지수 백오프 + full jitter 적용 (동시 재시도 분산)
+        backoff = base_delay * (2 ** attempt)
+        if max_delay is not None:
+            backoff = min(max_delay, backoff)
+        return random.uniform(0, backoff)
@@ -1,10 +1,18 @@
 """Configuration adapter implementation."""
 
 from enum import Enum
-from typing import List, Optional, Any, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import ClassVar, List, Optional, Any, Dict, Tuple, Type
+import os
+import sys
+
+import httpx
 from pydantic import Field, ConfigDict
-from pydantic_settings import BaseSettings
+from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings, PydanticBaseSettingsSource
 
+from config.settings import clear_settings_cache
 from core.ports.config import ConfigPort
 
 
@@ -16,15 +24,79 @@ class Environment(str, Enum):
     TEST = "test"
 
 
+# Placeholder JWT secret that must be overridden in production
+DEFAULT_SECRET_KEY = "your-secret-key-change-this-in-production"
+
+# Standard logging format used when LOG_FORMAT is not configured
+DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# String values accepted as True by ConfigAdapter.get_bool()
+_TRUE_STRINGS = frozenset(('true', '1', 'yes', 'on'))
+
+
+@lru_cache(maxsize=128)
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean setting string once; loaded settings strings are immutable."""
+    return value.lower() in _TRUE_STRINGS
+
+
+@lru_cache(maxsize=128)
+def _parse_csv(value: str) -> Tuple[str, ...]:
+    """Parse a comma-separated setting value once; loaded settings strings are immutable."""
+    return tuple(item for item in map(str.strip, value.split(',')) if item)
+
+
+# Values parsed from the .env file, keyed by the file's mtime at parse time
+_ENV_FILE_CACHE: Optional[Tuple[Optional[float], Dict[str, Any]]] = None
+
+
+def _env_file_mtime(env_file: str) -> Optional[float]:
+    """Return the .env file modification time, or None if it does not exist."""
+    try:
+        return os.stat(env_file).st_mtime
+    except OSError:
+        return None
+
+
+def _env_file_unchanged(env_file: str) -> bool:
+    """Check whether the cached .env values are still current."""
+    return _ENV_FILE_CACHE is not None and _ENV_FILE_CACHE[0] == _env_file_mtime(env_file)
+
+
+class _CachedDotEnvSettingsSource(PydanticBaseSettingsSource):
+    """Settings source serving previously parsed .env values."""
+    
+    def __init__(self, settings_cls: Type[BaseSettings], values: Dict[str, Any]):
+        super().__init__(settings_cls)
+        self._values = values
+    
+    def get_field_value(self, field: FieldInfo, field_name: str) -> Tuple[Any, str, bool]:
+        return self._values.get(field_name), field_name, False
+    
+    def __call__(self) -> Dict[str, Any]:
+        return dict(self._values)
+
+
 class ConfigAdapter(BaseSettings, ConfigPort):
     """Configuration adapter using Pydantic Settings."""
     
+    # Non-field per-instance state lives in slots: reads are a fixed-offset load
+    # instead of Pydantic's private-attribute lookup through __getattr__
+    __slots__ = (
+        "_init_kwargs", "_required_settings_validated", "_masked_settings",
+        "_is_development", "_is_production", "_is_test", "_is_staging",
+    )
+    
     # Environment Configuration
     environment: Environment = Field(Environment.DEVELOPMENT, description="Application environment", validation_alias="ENVIRONMENT")
     
     # Database Configuration
     database_url: str = Field(default="sqlite:///./graphapi.db", description="Database connection URL", validation_alias="DATABASE_URL")
     database_echo: bool = Field(False, description="Enable database query logging", validation_alias="DATABASE_ECHO")
+    db_pool_size: int = Field(20, description="Database connection pool size", validation_alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(10, description="Connections allowed beyond the pool size", validation_alias="DB_MAX_OVERFLOW")
+    db_pool_timeout: float = Field(30.0, description="Seconds to wait for a pooled connection", validation_alias="DB_POOL_TIMEOUT")
+    db_prepared_statement_cache_size: int = Field(100, description="Prepared statements cached per asyncpg connection (0 disables)", validation_alias="DB_PREPARED_STATEMENT_CACHE_SIZE")
     
     # Microsoft Graph API Configuration
     client_id: str = Field(default="", description="Microsoft client ID", validation_alias="CLIENT_ID")
@@ -34,11 +106,11 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         "https://login.microsoftonline.com/{tenant_id}",
         description="Microsoft authority URL"
     )
-    scopes: List[str] = Field(
-        default=[
+    scopes: Tuple[str, ...] = Field(
+        default=(
             "https://graph.microsoft.com/Mail.Read",
             "https://graph.microsoft.com/Mail.Send"
-        ],
+        ),
         description="Microsoft Graph API scopes"
     )
     redirect_uri: str = Field(
@@ -58,22 +130,23 @@ class ConfigAdapter(BaseSettings, ConfigPort):
     external_api_url: str = Field(default="", description="External API base URL", validation_alias="EXTERNAL_API_URL")
     external_api_key: str = Field(default="", description="External API key", validation_alias="EXTERNAL_API_KEY")
     
+    # HTTP Client Configuration (connection pool limits applied to each adapter's client)
+    httpx_max_connections: int = Field(20, description="Maximum concurrent HTTP connections per client", validation_alias="HTTPX_MAX_CONNECTIONS")
+    httpx_max_keepalive_connections: int = Field(10, description="Maximum idle keep-alive HTTP connections per client", validation_alias="HTTPX_MAX_KEEPALIVE_CONNECTIONS")
+    
     # FastAPI Configuration
     api_host: str = Field("0.0.0.0", description="API host", validation_alias="API_HOST")
     api_port: int = Field(5000, description="API port", validation_alias="API_PORT")
     api_reload: bool = Field(True, description="Enable API auto-reload", validation_alias="API_RELOAD")
     
     # JWT Configuration
-    secret_key: str = Field(default="your-secret-key-change-this-in-production", description="JWT secret key", validation_alias="SECRET_KEY")
+    secret_key: str = Field(default=DEFAULT_SECRET_KEY, description="JWT secret key", validation_alias="SECRET_KEY")
     algorithm: str = Field("HS256", description="JWT algorithm", validation_alias="ALGORITHM")
     access_token_expire_minutes: int = Field(30, description="Access token expiration minutes", validation_alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     
     # Logging Configuration
     log_level: str = Field("INFO", description="Logging level")
-    log_format: str = Field(
-        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="Log format string"
-    )
+    log_format: str = Field(DEFAULT_LOG_FORMAT, description="Log format string")
     
     # Email Detection Configuration
     email_check_interval: int = Field(300, description="Email check interval in seconds")  # 5 minutes
@@ -90,9 +163,107 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         case_sensitive=False,
         # Map field names to environment variable names
         env_prefix="",
-        extra="ignore"
+        extra="ignore",
+        # Settings are read-only once loaded; reload_settings() re-initializes in place
+        frozen=True
     )
     
+    # Settings that must be non-empty in production
+    _REQUIRED_PRODUCTION_SETTINGS: ClassVar[Tuple[str, ...]] = (
+        'client_id', 'client_secret', 'tenant_id',
+        'external_api_url', 'external_api_key', 'secret_key'
+    )
+    
+    # Short, non-secret strings returned on hot paths; interned once per load
+    _INTERNED_SETTINGS: ClassVar[Tuple[str, ...]] = (
+        'authority', 'graph_api_endpoint', 'algorithm',
+        'api_host', 'log_level', 'log_format'
+    )
+    
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: Type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> Tuple[PydanticBaseSettingsSource, ...]:
+        """Serve .env values from the parse cache while the file is unchanged."""
+        global _ENV_FILE_CACHE
+        env_file = cls.model_config["env_file"]
+        if not _env_file_unchanged(env_file):
+            _ENV_FILE_CACHE = (_env_file_mtime(env_file), dotenv_settings())
+        dotenv_settings = _CachedDotEnvSettingsSource(settings_cls, _ENV_FILE_CACHE[1])
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+    
+    def __init__(self, **values: Any) -> None:
+        super().__init__(**values)
+        # Kept so reload_settings() re-applies overrides such as ENVIRONMENT
+        object.__setattr__(self, "_init_kwargs", values)
+    
+    def model_post_init(self, __context: Any) -> None:
+        """Reset per-instance state after (re)loading settings."""
+        # Fields are frozen, so write the interned values straight into the field dict
+        fields = self.__dict__
+        for field_name in self._INTERNED_SETTINGS:
+            fields[field_name] = sys.intern(fields[field_name])
+        self._reset_state()
+    
+    def _reset_state(self) -> None:
+        """Reset slot state derived from the loaded field values."""
+        # Set once validate_required_settings() has succeeded for the loaded values
+        object.__setattr__(self, "_required_settings_validated", False)
+        # Masked get_all_settings() result, built on first use
+        object.__setattr__(self, "_masked_settings", None)
+        # Environment checks resolved once per load (members are singletons, so identity suffices)
+        environment = self.environment
+        object.__setattr__(self, "_is_development", environment is Environment.DEVELOPMENT)
+        object.__setattr__(self, "_is_production", environment is Environment.PRODUCTION)
+        object.__setattr__(self, "_is_test", environment is Environment.TEST)
+        object.__setattr__(self, "_is_staging", environment is Environment.STAGING)
+    
+    # Pydantic copies and pickles only __dict__ and its private attributes, so
+    # the slot state is carried over explicitly; the values are immutable or
+    # never mutated in place, so copies may share them
+    def _copy_slots_to(self, other: "ConfigAdapter") -> None:
+        """Copy the slot state onto another instance."""
+        for name in ConfigAdapter.__slots__:
+            object.__setattr__(other, name, getattr(self, name))
+    
+    def __copy__(self) -> "ConfigAdapter":
+        """Shallow copy, including slot state."""
+        copied = super().__copy__()
+        self._copy_slots_to(copied)
+        return copied
+    
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "ConfigAdapter":
+        """Deep copy, including slot state."""
+        copied = super().__deepcopy__(memo)
+        self._copy_slots_to(copied)
+        return copied
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle state, including slot state."""
+        state = super().__getstate__()
+        state["__config_adapter_slots__"] = {name: getattr(self, name) for name in ConfigAdapter.__slots__}
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore pickle state, including slot state."""
+        state = dict(state)
+        slots = state.pop("__config_adapter_slots__", {})
+        super().__setstate__(state)
+        for name, value in slots.items():
+            object.__setattr__(self, name, value)
+    
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "ConfigAdapter":
+        """Copy the adapter; updated field values re-derive the cached slot state."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._reset_state()
+        return copied
+    
     # ConfigPort interface implementation
     def get_environment(self) -> str:
         """Get current environment."""
@@ -106,6 +277,22 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         """Get database echo setting."""
         return self.database_echo
     
+    def get_pool_size(self) -> int:
+        """Get database connection pool size."""
+        return self.db_pool_size
+    
+    def get_max_overflow(self) -> int:
+        """Get number of connections allowed beyond the pool size."""
+        return self.db_max_overflow
+    
+    def get_pool_timeout(self) -> float:
+        """Get seconds to wait for a pooled database connection."""
+        return self.db_pool_timeout
+    
+    def get_prepared_statement_cache_size(self) -> int:
+        """Get number of prepared statements cached per asyncpg connection."""
+        return self.db_prepared_statement_cache_size
+    
     def get_client_id(self) -> str:
         """Get Microsoft client ID."""
         return self.client_id
@@ -120,9 +307,13 @@ class ConfigAdapter(BaseSettings, ConfigPort):
     
     def get_authority(self) -> str:
         """Get Microsoft authority URL."""
-        return self.authority.format(tenant_id=self.tenant_id)
+        # Plain substitution; avoids running the str.format parser on every call
+        authority = self.authority
+        if "{tenant_id}" in authority:
+            return authority.replace("{tenant_id}", self.tenant_id)
+        return authority
     
-    def get_scopes(self) -> List[str]:
+    def get_scopes(self) -> Tuple[str, ...]:
         """Get Microsoft Graph API scopes."""
         return self.scopes
     
@@ -146,6 +337,22 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         """Get external API key."""
         return self.external_api_key
     
+    def get_httpx_max_connections(self) -> int:
+        """Get maximum concurrent HTTP connections per client."""
+        return self.httpx_max_connections
+    
+    def get_httpx_max_keepalive_connections(self) -> int:
+        """Get maximum idle keep-alive HTTP connections per client."""
+        return self.httpx_max_keepalive_connections
+    
+    def get_httpx_limits(self) -> httpx.Limits:
+        """Get HTTPX connection pool limits."""
+        return httpx.Limits(
+            max_connections=self.httpx_max_connections,
+            max_keepalive_connections=self.httpx_max_keepalive_connections,
+            keepalive_expiry=5.0
+        )
+    
     def get_api_host(self) -> str:
         """Get API host."""
         return self.api_host
@@ -200,24 +407,26 @@ class ConfigAdapter(BaseSettings, ConfigPort):
     
     def is_development(self) -> bool:
         """Check if running in development mode."""
-        return self.environment == Environment.DEVELOPMENT
+        return self._is_development
     
     def is_production(self) -> bool:
         """Check if running in production mode."""
-        return self.environment == Environment.PRODUCTION
+        return self._is_production
     
     def is_test(self) -> bool:
         """Check if running in test mode."""
-        return self.environment == Environment.TEST
+        return self._is_test
     
     def is_staging(self) -> bool:
         """Check if running in staging mode."""
-        return self.environment == Environment.STAGING
+        return self._is_staging
     
     # Generic configuration methods
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key."""
-        return getattr(self, key, default)
+        # Loaded field values live in the instance __dict__ (refreshed by reload_settings),
+        # so a plain dict lookup avoids the full attribute protocol on every access
+        return self.__dict__.get(key, default)
     
     def get_string(self, key: str, default: str = "") -> str:
         """Get string configuration value."""
@@ -227,26 +436,37 @@ class ConfigAdapter(BaseSettings, ConfigPort):
     def get_int(self, key: str, default: int = 0) -> int:
         """Get integer configuration value."""
         value = self.get(key, default)
+        # Pydantic already stores typed values, so the common case skips conversion
+        if type(value) is int:
+            return value
+        if value is None:
+            return default
         try:
-            return int(value) if value is not None else default
+            return int(value)
         except (ValueError, TypeError):
             return default
     
     def get_float(self, key: str, default: float = 0.0) -> float:
         """Get float configuration value."""
         value = self.get(key, default)
+        if type(value) is float:
+            return value
+        if value is None:
+            return default
         try:
-            return float(value) if value is not None else default
+            return float(value)
         except (ValueError, TypeError):
             return default
     
     def get_bool(self, key: str, default: bool = False) -> bool:
         """Get boolean configuration value."""
         value = self.get(key, default)
-        if isinstance(value, bool):
+        value_class = value.__class__
+        # Exact-class checks cover the common cases without an isinstance() MRO walk
+        if value_class is bool:
             return value
-        if isinstance(value, str):
-            return value.lower() in ('true', '1', 'yes', 'on')
+        if value_class is str or isinstance(value, str):
+            return _parse_bool(value)
         return bool(value) if value is not None else default
     
     def get_list(self, key: str, default: List[Any] = None) -> List[Any]:
@@ -254,11 +474,16 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         if default is None:
             default = []
         value = self.get(key, default)
+        value_class = value.__class__
+        if value_class is list:
+            return value
+        if value_class is tuple:
+            return list(value)
+        if value_class is str or isinstance(value, str):
+            # Comma-separated values are tokenized once per distinct string
+            return list(_parse_csv(value))
         if isinstance(value, list):
             return value
-        if isinstance(value, str):
-            # Try to parse comma-separated values
-            return [item.strip() for item in value.split(',') if item.strip()]
         return default
     
     def get_dict(self, key: str, default: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -266,45 +491,85 @@ class ConfigAdapter(BaseSettings, ConfigPort):
         if default is None:
             default = {}
         value = self.get(key, default)
+        if type(value) is dict:
+            return value
         return value if isinstance(value, dict) else default
     
     def validate_required_settings(self) -> bool:
         """Validate that all required settings are present."""
+        if self._required_settings_validated:
+            return True
+        
         # In production, validate that critical settings are not empty
         if self.is_production():
-            required_settings = [
-                'client_id', 'client_secret', 'tenant_id',
-                'external_api_url', 'external_api_key', 'secret_key'
+            values = _REQUIRED_PRODUCTION_GETTER(self)
+            missing = [
+                setting for setting, value in zip(self._REQUIRED_PRODUCTION_SETTINGS, values)
+                if not value
             ]
-            for setting in required_settings:
-                value = getattr(self, setting, None)
-                if not value or value == "":
-                    raise ValueError(f"Required setting '{setting}' is missing or empty")
+            if missing:
+                raise ValueError(f"Required settings are missing or empty: {', '.join(missing)}")
+            if self.secret_key == DEFAULT_SECRET_KEY:
+                raise ValueError("Secret key must be changed in production environment")
+        
+        object.__setattr__(self, "_required_settings_validated", True)
         return True
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Get all configuration settings (sensitive values masked)."""
-        settings = {}
-        for field_name, field_info in self.model_fields.items():
-            value = getattr(self, field_name)
-            # Mask sensitive values
-            if any(sensitive in field_name.lower() for sensitive in ['secret', 'key', 'password', 'token']):
-                if value:
-                    settings[field_name] = "***masked***"
-                else:
-                    settings[field_name] = value
-            else:
-                settings[field_name] = value
-        return settings
+        # Fields are frozen until reload_settings(), so the masked view is built once
+        if self._masked_settings is None:
+            # Field values live in the instance __dict__; mask sensitive ones in a single pass
+            object.__setattr__(self, "_masked_settings", {
+                field_name: "***masked***" if value and field_name in _SENSITIVE_FIELDS else value
+                for field_name, value in self.__dict__.items()
+            })
+        return dict(self._masked_settings)
     
     def reload_settings(self) -> None:
         """Reload configuration from source."""
-        # For Pydantic Settings, we would need to recreate the instance
-        # This is a placeholder implementation
-        pass
+        # Re-run Pydantic Settings initialization in place, with the same init
+        # overrides, so existing references, including the instance cached by
+        # create_config_adapter() and get_config_adapter(), observe the new
+        # values; only the separate config.settings cache is dropped.
+        # settings_customise_sources() skips re-parsing an unchanged .env file
+        self.__init__(**self._init_kwargs)
+        clear_settings_cache()
+
+
+# Field names whose values are masked by get_all_settings(), resolved once at import
+# (connection strings and DSNs are included since they can embed credentials)
+_SENSITIVE_FIELDS = frozenset(
+    field_name for field_name in ConfigAdapter.model_fields
+    if any(sensitive in field_name.lower() for sensitive in ('secret', 'key', 'password', 'token'))
+) | frozenset(('database_url', 'sentry_dsn'))
+
+
+# Reads every required production setting in one call
+_REQUIRED_PRODUCTION_GETTER = attrgetter(*ConfigAdapter._REQUIRED_PRODUCTION_SETTINGS)
 
 
 # Factory function for dependency injection
-def create_config_adapter() -> ConfigAdapter:
-    """Create configuration adapter instance."""
-    return ConfigAdapter()
+@lru_cache(maxsize=None)
+def create_config_adapter(environment: Optional[str] = None) -> ConfigAdapter:
+    """
+    Create configuration adapter instance (cached per process and environment).
+    
+    Args:
+        environment: Environment to load instead of the ENVIRONMENT variable;
+            passed to the adapter directly rather than written to os.environ
+    """
+    if environment is None:
+        return ConfigAdapter()
+    return ConfigAdapter(ENVIRONMENT=environment)
+
+
+@lru_cache(maxsize=1)
+def get_config_adapter() -> ConfigAdapter:
+    """
+    Get the process-wide configuration adapter.
+    
+    Safe to use directly as a FastAPI dependency (``Depends(get_config_adapter)``):
+    every request receives the same instance.
+    """
+    return create_config_adapter()
@@ -1,19 +1,6 @@
 """Database adapters package."""
 
-from .models import (
-    Base,
-    UserModel,
-    AccountModel,
-    EmailModel,
-    TransmissionRecordModel,
-)
-from .repositories import (
-    SQLUserRepository,
-    SQLAccountRepository,
-    SQLEmailRepository,
-    SQLTransmissionRecordRepository,
-)
-from .database import DatabaseAdapter, get_database_session
+from importlib import import_module
 
 __all__ = [
     # Models
@@ -21,6 +8,7 @@ __all__ = [
     "UserModel",
     "AccountModel", 
     "EmailModel",
+    "EmailBodyModel",
     "TransmissionRecordModel",
     
     # Repositories
@@ -33,3 +21,34 @@ __all__ = [
     "DatabaseAdapter",
     "get_database_session",
 ]
+
+# Submodule providing each public name; imported on first attribute access so
+# that importing one submodule does not pull in the ORM models and engines of all
+_SUBMODULE_BY_NAME = {
+    "Base": ".models",
+    "UserModel": ".models",
+    "AccountModel": ".models",
+    "EmailModel": ".models",
+    "EmailBodyModel": ".models",
+    "TransmissionRecordModel": ".models",
+    "SQLUserRepository": ".repositories",
+    "SQLAccountRepository": ".repositories",
+    "SQLEmailRepository": ".repositories",
+    "SQLTransmissionRecordRepository": ".repositories",
+    "DatabaseAdapter": ".database",
+    "get_database_session": ".database",
+}
+
+
+def __getattr__(name: str):
+    """Resolve public names from their submodule on first use (PEP 562)."""
+    submodule = _SUBMODULE_BY_NAME.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
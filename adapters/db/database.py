@@ -1,52 +1,108 @@
 """Database connection and session management."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, AsyncGenerator, AsyncIterator, Generator, Optional, Tuple
 
-from sqlalchemy import create_engine, event, text
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Row, make_url
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool, StaticPool
 
 from core.ports.config import ConfigPort
 from core.utils.security import SecurityUtils
-from .models import Base
+
+if TYPE_CHECKING:
+    # The asyncio extension and the ORM models are imported where used, so
+    # sync-only callers (CLI, migrations) don't load them at import time
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 
 logger = logging.getLogger(__name__)
 
+# Sync URL scheme -> async driver scheme used by _convert_to_async_url()
+_ASYNC_URL_SCHEMES = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+# Pragmas applied to every new SQLite connection, sent as a single script
+_SQLITE_PRAGMAS = (
+    "PRAGMA foreign_keys=ON;"
+    "PRAGMA journal_mode=WAL;"
+    "PRAGMA synchronous=NORMAL;"
+    "PRAGMA temp_store=MEMORY;"
+    "PRAGMA mmap_size=268435456;"  # 256MB
+)
+
 
 class DatabaseAdapter:
-    """Database adapter for managing connections and sessions."""
+    """
+    Database adapter for managing connections and sessions.
     
-    def __init__(self, config: ConfigPort):
+    List endpoints reading many rows should prefer stream(), which yields
+    rows from a server-side cursor instead of buffering the whole result
+    the way session.execute(...).fetchall() does.
+    """
+    
+    def __init__(self, config: ConfigPort, pooled: bool = True):
         """
         Initialize database adapter.
         
         Args:
             config: Configuration port instance
+            pooled: Keep a connection pool; False opens a fresh connection per
+                checkout (NullPool) for short-lived CLI/migration work
         """
         self.config = config
+        self._pooled = pooled
         self._engine = None
         self._async_engine = None
         self._session_factory = None
         self._async_session_factory = None
         
-        # Initialize engines and session factories
-        self._setup_engines()
-        self._setup_session_factories()
+        # URLs are immutable for the adapter's lifetime; derive and mask them once
+        self._database_url = self.config.get_database_url()
+        self._async_database_url = self._convert_to_async_url(self._database_url)
+        self._is_sqlite = self._database_url.startswith("sqlite")
+        self._masked_url = self._mask_url(self._database_url)
+        self._masked_async_url = self._mask_url(self._async_database_url)
+        
+        # Engines and session factories are created on first use, so a caller
+        # that only needs the sync or the async side never builds the other
+        logger.info(f"Database adapter configured with URL: {self._masked_url}")
     
-    def _setup_engines(self) -> None:
-        """Setup synchronous and asynchronous database engines."""
-        database_url = self.config.get_database_url()
+    @classmethod
+    def for_migration(cls, config: ConfigPort) -> "DatabaseAdapter":
+        """Create an adapter for one-off schema work that holds no idle connections."""
+        return cls(config, pooled=False)
+    
+    @property
+    def engine(self):
+        """Synchronous database engine, created on first use."""
+        if self._engine is None:
+            self._engine = self._create_sync_engine()
+        return self._engine
+    
+    @property
+    def async_engine(self):
+        """Asynchronous database engine, created on first use."""
+        if self._async_engine is None:
+            self._async_engine = self._create_async_engine()
+        return self._async_engine
+    
+    def _create_sync_engine(self):
+        """Create the synchronous database engine."""
         echo = self.config.get_database_echo()
         
-        # Synchronous engine
-        if database_url.startswith("sqlite"):
+        if self._is_sqlite:
             # SQLite specific configuration
-            self._engine = create_engine(
-                database_url,
+            engine = create_engine(
+                self._database_url,
                 echo=echo,
                 poolclass=StaticPool,
                 connect_args={
@@ -54,23 +110,37 @@ class DatabaseAdapter:
                     "timeout": 20
                 }
             )
+        elif not self._pooled:
+            engine = create_engine(self._database_url, echo=echo, poolclass=NullPool)
         else:
             # PostgreSQL/MySQL configuration
-            self._engine = create_engine(
-                database_url,
+            engine = create_engine(
+                self._database_url,
                 echo=echo,
-                pool_size=10,
-                max_overflow=20,
+                pool_size=self.config.get_pool_size(),
+                max_overflow=self.config.get_max_overflow(),
+                pool_timeout=self.config.get_pool_timeout(),
                 pool_pre_ping=True,
-                pool_recycle=3600
+                pool_recycle=3600,
+                **self._sync_executemany_args(self._database_url)
             )
         
-        # Asynchronous engine
-        async_database_url = self._convert_to_async_url(database_url)
+        # Add event listeners
+        self._setup_event_listeners(engine)
+        
+        logger.info("Sync database engine initialized")
+        return engine
+    
+    def _create_async_engine(self):
+        """Create the asynchronous database engine."""
+        from sqlalchemy.ext.asyncio import create_async_engine
+        
+        async_database_url = self._async_database_url
+        echo = self.config.get_database_echo()
         
         if async_database_url.startswith("sqlite+aiosqlite"):
             # Async SQLite configuration
-            self._async_engine = create_async_engine(
+            engine = create_async_engine(
                 async_database_url,
                 echo=echo,
                 poolclass=StaticPool,
@@ -79,135 +149,186 @@ class DatabaseAdapter:
                     "timeout": 20
                 }
             )
+        elif not self._pooled:
+            engine = create_async_engine(async_database_url, echo=echo, poolclass=NullPool)
         else:
-            # Async PostgreSQL configuration
-            self._async_engine = create_async_engine(
+            # Async PostgreSQL configuration; LIFO checkout keeps the hot
+            # connections busy and lets idle ones age out
+            engine = create_async_engine(
                 async_database_url,
                 echo=echo,
-                pool_size=10,
-                max_overflow=20,
+                poolclass=AsyncAdaptedQueuePool,
+                pool_size=self.config.get_pool_size(),
+                max_overflow=self.config.get_max_overflow(),
+                pool_timeout=self.config.get_pool_timeout(),
                 pool_pre_ping=True,
-                pool_recycle=3600
+                pool_recycle=3600,
+                pool_use_lifo=True,
+                connect_args=self._async_connect_args(async_database_url)
             )
         
-        # Add event listeners
-        self._setup_event_listeners()
-        
-        logger.info(f"Database engines initialized with URL: {self._mask_url(database_url)}")
+        logger.info("Async database engine initialized")
+        return engine
+    
+    def _sync_executemany_args(self, database_url: str) -> dict:
+        """Batching options for psycopg2 executemany, used by bulk email inserts."""
+        # Resolve the driver rather than matching the scheme: plain
+        # "postgresql://" maps to psycopg2 or psycopg depending on SQLAlchemy
+        if make_url(database_url).get_dialect().driver != "psycopg2":
+            return {}
+        return {
+            # INSERTs go out as multi-VALUES statements of up to 10k rows;
+            # UPDATE/DELETE executemany use execute_batch pages instead
+            "executemany_mode": "values_plus_batch",
+            "executemany_batch_page_size": 1000,
+            "insertmanyvalues_page_size": 10_000,
+        }
+    
+    def _async_connect_args(self, async_database_url: str) -> dict:
+        """Driver connect arguments for a pooled async engine."""
+        if not async_database_url.startswith("postgresql+asyncpg"):
+            return {}
+        return {
+            # SQLAlchemy's bounded per-connection prepared statement cache;
+            # asyncpg's own statement cache is disabled so only one applies
+            "prepared_statement_cache_size": self.config.get_prepared_statement_cache_size() or 0,
+            "statement_cache_size": 0,
+            # Skip JIT planning, which slows connection setup and short queries
+            "server_settings": {"jit": "off"},
+        }
     
     def _convert_to_async_url(self, sync_url: str) -> str:
         """Convert synchronous database URL to asynchronous."""
-        if sync_url.startswith("sqlite:///"):
-            return sync_url.replace("sqlite:///", "sqlite+aiosqlite:///")
-        elif sync_url.startswith("postgresql://"):
-            return sync_url.replace("postgresql://", "postgresql+asyncpg://")
-        elif sync_url.startswith("mysql://"):
-            return sync_url.replace("mysql://", "mysql+aiomysql://")
-        else:
+        scheme, separator, rest = sync_url.partition("://")
+        async_scheme = _ASYNC_URL_SCHEMES.get(scheme)
+        if async_scheme is None or not separator:
             return sync_url
+        return f"{async_scheme}://{rest}"
     
     def _mask_url(self, url: str) -> str:
         """Mask sensitive information in database URL for logging."""
         return SecurityUtils.mask_url(url)
     
-    def _setup_session_factories(self) -> None:
-        """Setup session factories for sync and async operations."""
-        # Synchronous session factory
-        self._session_factory = sessionmaker(
-            bind=self._engine,
-            class_=Session,
-            expire_on_commit=False
-        )
-        
-        # Asynchronous session factory
-        self._async_session_factory = async_sessionmaker(
-            bind=self._async_engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
-        
-        logger.info("Database session factories initialized")
+    @property
+    def session_factory(self) -> sessionmaker:
+        """Synchronous session factory, created on first use."""
+        if self._session_factory is None:
+            self._session_factory = sessionmaker(
+                bind=self.engine,
+                class_=Session,
+                expire_on_commit=False
+            )
+        return self._session_factory
     
-    def _setup_event_listeners(self) -> None:
+    @property
+    def async_session_factory(self) -> "async_sessionmaker":
+        """Asynchronous session factory, created on first use."""
+        if self._async_session_factory is None:
+            from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+            
+            self._async_session_factory = async_sessionmaker(
+                bind=self.async_engine,
+                class_=AsyncSession,
+                expire_on_commit=False
+            )
+        return self._async_session_factory
+    
+    def _setup_event_listeners(self, engine) -> None:
         """Setup database event listeners."""
         
-        @event.listens_for(self._engine, "connect")
-        def set_sqlite_pragma(dbapi_connection, connection_record):
-            """Set SQLite pragmas for better performance and reliability."""
-            if "sqlite" in str(self._engine.url):
+        if self._is_sqlite:
+            @event.listens_for(engine, "connect")
+            def set_sqlite_pragma(dbapi_connection, connection_record):
+                """Set SQLite pragmas for better performance and reliability."""
                 cursor = dbapi_connection.cursor()
-                cursor.execute("PRAGMA foreign_keys=ON")
-                cursor.execute("PRAGMA journal_mode=WAL")
-                cursor.execute("PRAGMA synchronous=NORMAL")
-                cursor.execute("PRAGMA temp_store=MEMORY")
-                cursor.execute("PRAGMA mmap_size=268435456")  # 256MB
+                cursor.executescript(_SQLITE_PRAGMAS)
                 cursor.close()
         
-        @event.listens_for(self._engine, "checkout")
-        def receive_checkout(dbapi_connection, connection_record, connection_proxy):
-            """Log database connection checkout."""
-            logger.debug("Database connection checked out")
-        
-        @event.listens_for(self._engine, "checkin")
-        def receive_checkin(dbapi_connection, connection_record):
-            """Log database connection checkin."""
-            logger.debug("Database connection checked in")
+        # Pool checkout/checkin fire per session; only pay for them when they would log
+        if logger.isEnabledFor(logging.DEBUG):
+            @event.listens_for(engine, "checkout")
+            def receive_checkout(dbapi_connection, connection_record, connection_proxy):
+                """Log database connection checkout."""
+                logger.debug("Database connection checked out")
+            
+            @event.listens_for(engine, "checkin")
+            def receive_checkin(dbapi_connection, connection_record):
+                """Log database connection checkin."""
+                logger.debug("Database connection checked in")
     
     # Synchronous methods
     def get_session(self) -> Session:
         """Get synchronous database session."""
-        if not self._session_factory:
-            raise RuntimeError("Database not initialized")
-        return self._session_factory()
+        return self.session_factory()
     
     def create_tables(self) -> None:
         """Create all database tables."""
-        if not self._engine:
-            raise RuntimeError("Database engine not initialized")
-        
+        from .models import Base
+
         logger.info("Creating database tables...")
-        Base.metadata.create_all(bind=self._engine)
+        Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created successfully")
     
     def drop_tables(self) -> None:
         """Drop all database tables."""
-        if not self._engine:
-            raise RuntimeError("Database engine not initialized")
-        
+        from .models import Base
+
         logger.warning("Dropping all database tables...")
-        Base.metadata.drop_all(bind=self._engine)
+        Base.metadata.drop_all(bind=self.engine)
         logger.warning("All database tables dropped")
     
     # Asynchronous methods
-    async def get_async_session(self) -> AsyncSession:
+    async def get_async_session(self) -> "AsyncSession":
         """Get asynchronous database session."""
-        if not self._async_session_factory:
-            raise RuntimeError("Async database not initialized")
-        return self._async_session_factory()
+        return self.async_session_factory()
     
     async def create_tables_async(self) -> None:
         """Create all database tables asynchronously."""
-        if not self._async_engine:
-            raise RuntimeError("Async database engine not initialized")
-        
+        from .models import Base
+
         logger.info("Creating database tables asynchronously...")
-        async with self._async_engine.begin() as conn:
+        async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created successfully")
     
     async def drop_tables_async(self) -> None:
         """Drop all database tables asynchronously."""
-        if not self._async_engine:
-            raise RuntimeError("Async database engine not initialized")
-        
+        from .models import Base
+
         logger.warning("Dropping all database tables asynchronously...")
-        async with self._async_engine.begin() as conn:
+        async with self.async_engine.begin() as conn:
             await conn.run_sync(Base.metadata.drop_all)
         logger.warning("All database tables dropped")
     
+    async def warmup(self) -> None:
+        """
+        Open pool_size connections concurrently and return them to the pool.
+        
+        Lets the first requests after startup find established connections
+        instead of each paying the connect/authentication roundtrip.
+        """
+        async_engine = self.async_engine
+        if isinstance(async_engine.pool, StaticPool):
+            # SQLite shares a single connection; nothing to pre-open
+            return
+        
+        pool_size = async_engine.pool.size()
+        results = await asyncio.gather(
+            *(async_engine.connect().start() for _ in range(pool_size)),
+            return_exceptions=True
+        )
+        connections = [result for result in results if not isinstance(result, BaseException)]
+        await asyncio.gather(*(connection.close() for connection in connections))
+        
+        failed = len(results) - len(connections)
+        if failed:
+            logger.warning(f"Database pool warmup opened {len(connections)} connections, {failed} failed")
+        else:
+            logger.info(f"Database pool warmed up with {len(connections)} connections")
+    
     # Context managers
     @asynccontextmanager
-    async def async_session_scope(self) -> AsyncGenerator[AsyncSession, None]:
+    async def async_session_scope(self) -> AsyncGenerator["AsyncSession", None]:
         """
         Async context manager for database sessions with automatic commit/rollback.
         
@@ -227,6 +348,43 @@ class DatabaseAdapter:
         finally:
             await session.close()
     
+    @asynccontextmanager
+    async def readonly_session_scope(self) -> AsyncGenerator["AsyncSession", None]:
+        """
+        Async context manager for read-only database sessions.
+        
+        Nothing is committed: closing the session rolls back the implicit
+        transaction, saving the COMMIT roundtrip on read paths.
+        
+        Usage:
+            async with db_adapter.readonly_session_scope() as session:
+                # Read with session here
+                pass
+        """
+        session = await self.get_async_session()
+        try:
+            yield session
+        finally:
+            await session.close()
+    
+    async def stream(self, query: Any) -> AsyncIterator[Row]:
+        """
+        Stream rows of a Core select or text() query.
+        
+        Rows are fetched from a server-side cursor as the caller iterates, so
+        memory stays bounded by the driver's fetch batch rather than the full
+        result set.
+        
+        Usage:
+            async for row in db_adapter.stream(select(EmailModel)):
+                # Handle row here
+                pass
+        """
+        async with self.async_engine.connect() as connection:
+            result = await connection.stream(query)
+            async for row in result:
+                yield row
+    
     def session_scope(self):
         """
         Context manager for synchronous database sessions with automatic commit/rollback.
@@ -236,22 +394,7 @@ class DatabaseAdapter:
                 # Use session here
                 pass
         """
-        from contextlib import contextmanager
-        
-        @contextmanager
-        def _session_scope():
-            session = self.get_session()
-            try:
-                yield session
-                session.commit()
-            except Exception as e:
-                session.rollback()
-                logger.error(f"Database session rolled back due to error: {e}")
-                raise
-            finally:
-                session.close()
-        
-        return _session_scope()
+        return _sync_session_scope(self)
     
     # Health check and maintenance
     async def health_check(self) -> bool:
@@ -262,8 +405,9 @@ class DatabaseAdapter:
             True if database is healthy, False otherwise
         """
         try:
-            async with self.async_session_scope() as session:
-                result = await session.execute(text("SELECT 1"))
+            # A bare connection is enough for a probe; no ORM session or commit
+            async with self.async_engine.connect() as connection:
+                result = await connection.exec_driver_sql("SELECT 1")
                 return result.scalar() == 1
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
@@ -277,38 +421,85 @@ class DatabaseAdapter:
             True if database is healthy, False otherwise
         """
         try:
-            with self.session_scope() as session:
-                result = session.execute(text("SELECT 1"))
+            with self.engine.connect() as connection:
+                result = connection.exec_driver_sql("SELECT 1")
                 return result.scalar() == 1
         except Exception as e:
             logger.error(f"Database health check failed: {e}")
             return False
     
     async def get_connection_info(self) -> dict:
-        """Get database connection information."""
+        """
+        Get database connection information.
+        
+        Pool statistics are read in-process without touching the database;
+        use health_check() for connectivity.
+        """
+        pool = self.async_engine.pool
+        if isinstance(pool, QueuePool):
+            return {
+                "url": self._masked_async_url,
+                "pool_size": pool.size(),
+                "checked_in_connections": pool.checkedin(),
+                "checked_out_connections": pool.checkedout(),
+                "overflow_connections": pool.overflow(),
+            }
+        # StaticPool (SQLite) and NullPool keep no queue to report on
         return {
-            "url": self._mask_url(str(self._async_engine.url)),
-            "pool_size": getattr(self._async_engine.pool, 'size', None),
-            "checked_out_connections": getattr(self._async_engine.pool, 'checkedout', None),
-            "overflow_connections": getattr(self._async_engine.pool, 'overflow', None),
-            "is_healthy": await self.health_check()
+            "url": self._masked_async_url,
+            "pool_size": None,
+            "checked_in_connections": None,
+            "checked_out_connections": None,
+            "overflow_connections": None,
         }
     
     # Cleanup
     async def close(self) -> None:
         """Close database connections and cleanup resources."""
-        if self._async_engine:
-            await self._async_engine.dispose()
-            logger.info("Async database engine disposed")
+        # Drain both pools concurrently; the sync dispose blocks, so it runs
+        # in a worker thread
+        disposals = []
+        if self._async_engine is not None:
+            disposals.append(self._async_engine.dispose())
+        if self._engine is not None:
+            disposals.append(asyncio.to_thread(self._engine.dispose))
+        if not disposals:
+            return
+        
+        await asyncio.gather(*disposals)
         
-        if self._engine:
-            self._engine.dispose()
+        if self._async_engine is not None:
+            logger.info("Async database engine disposed")
+        if self._engine is not None:
             logger.info("Sync database engine disposed")
 
 
+@contextmanager
+def _sync_session_scope(db_adapter: DatabaseAdapter) -> Generator[Session, None, None]:
+    """Commit/rollback scope behind DatabaseAdapter.session_scope()."""
+    session = db_adapter.get_session()
+    try:
+        yield session
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        logger.error(f"Database session rolled back due to error: {e}")
+        raise
+    finally:
+        session.close()
+
+
 # Global database adapter instance
 _database_adapter: Optional[DatabaseAdapter] = None
 
+# Per-context override of the global adapter (e.g. one fake adapter per test
+# task); a ContextVar alone would not do as the process-wide default, since
+# FastAPI runs sync dependencies in worker threads whose context changes are
+# discarded
+_database_adapter_override: ContextVar[Optional[DatabaseAdapter]] = ContextVar(
+    "database_adapter_override", default=None
+)
+
 
 def initialize_database(config: ConfigPort) -> DatabaseAdapter:
     """
@@ -327,21 +518,39 @@ def initialize_database(config: ConfigPort) -> DatabaseAdapter:
 
 def get_database_adapter() -> DatabaseAdapter:
     """
-    Get global database adapter instance.
+    Get the database adapter for the current context.
     
     Returns:
-        DatabaseAdapter instance
+        DatabaseAdapter instance (the context override if set, else the global one)
         
     Raises:
         RuntimeError: If database not initialized
     """
-    if _database_adapter is None:
+    db_adapter = _database_adapter_override.get() or _database_adapter
+    if db_adapter is None:
         raise RuntimeError("Database not initialized. Call initialize_database() first.")
-    return _database_adapter
+    return db_adapter
+
+
+@contextmanager
+def override_database_adapter(db_adapter: DatabaseAdapter) -> Generator[DatabaseAdapter, None, None]:
+    """
+    Make get_database_adapter() return db_adapter within the current context.
+    
+    Usage:
+        with override_database_adapter(fake_adapter):
+            # Code here (and tasks it creates) sees fake_adapter
+            pass
+    """
+    token = _database_adapter_override.set(db_adapter)
+    try:
+        yield db_adapter
+    finally:
+        _database_adapter_override.reset(token)
 
 
 # Dependency injection functions for FastAPI
-async def get_database_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_database_session() -> AsyncGenerator["AsyncSession", None]:
     """
     FastAPI dependency for getting async database session.
     
@@ -365,6 +574,21 @@ def get_sync_database_session() -> Session:
 
 
 # Database migration utilities
+def _get_migration_adapter(config: ConfigPort) -> Tuple[DatabaseAdapter, bool]:
+    """
+    Get the adapter to run a migration with.
+    
+    Reuses the global adapter when it was initialized with the same config.
+    
+    Returns:
+        Tuple of (adapter, whether the caller owns it and must dispose it)
+    """
+    current = _database_adapter_override.get() or _database_adapter
+    if current is not None and current.config is config:
+        return current, False
+    return DatabaseAdapter.for_migration(config), True
+
+
 async def migrate_database(config: ConfigPort, drop_existing: bool = False) -> None:
     """
     Migrate database schema.
@@ -373,7 +597,7 @@ async def migrate_database(config: ConfigPort, drop_existing: bool = False) -> N
         config: Configuration port instance
         drop_existing: Whether to drop existing tables first
     """
-    db_adapter = DatabaseAdapter(config)
+    db_adapter, owned = _get_migration_adapter(config)
     
     try:
         if drop_existing:
@@ -386,7 +610,8 @@ async def migrate_database(config: ConfigPort, drop_existing: bool = False) -> N
         logger.error(f"Database migration failed: {e}")
         raise
     finally:
-        await db_adapter.close()
+        if owned:
+            await db_adapter.close()
 
 
 def migrate_database_sync(config: ConfigPort, drop_existing: bool = False) -> None:
@@ -397,7 +622,7 @@ def migrate_database_sync(config: ConfigPort, drop_existing: bool = False) -> No
         config: Configuration port instance
         drop_existing: Whether to drop existing tables first
     """
-    db_adapter = DatabaseAdapter(config)
+    db_adapter, owned = _get_migration_adapter(config)
     
     try:
         if drop_existing:
@@ -410,5 +635,5 @@ def migrate_database_sync(config: ConfigPort, drop_existing: bool = False) -> No
         logger.error(f"Database migration failed: {e}")
         raise
     finally:
-        if db_adapter._engine:
-            db_adapter._engine.dispose()
+        if owned:
+            db_adapter.engine.dispose()
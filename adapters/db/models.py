@@ -1,52 +1,121 @@
 """SQLAlchemy models for database entities."""
 
-from datetime import datetime
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
-from uuid import UUID, uuid4
+from uuid import UUID
 import json
+import os
+import time
 
 from sqlalchemy import (
-    Column, String, DateTime, Boolean, Integer, Text, 
-    ForeignKey, JSON, Index, UniqueConstraint, TypeDecorator
+    BINARY, DDL, Column, MetaData, String, DateTime, Boolean, Integer, Text, 
+    ForeignKey, JSON, Index, UniqueConstraint, TypeDecorator, event, text
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.sql import func
 
-# Create base class
-Base = declarative_base()
+from core.domain.user import User, UserStatus
+from core.domain.account import Account, AccountStatus
+from core.domain.email import Email
+from core.domain.transmission_record import TransmissionRecord
+
+# Create base class; constraints and column-level indexes get deterministic
+# names, so migrations can refer to them without reflecting the database
+Base = declarative_base(metadata=MetaData(naming_convention={
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}))
+
+# Relationships default to lazy="raise_on_sql": an unplanned lazy load in a
+# loop raises instead of issuing one query per row. Callers that need a
+# related object ask for it with selectinload()/joinedload().
+
+# Stored as jsonb on PostgreSQL (parsed once on write, indexable with GIN and
+# ->> expressions); plain JSON elsewhere
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def _uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new primary
+    keys land at the right edge of the index instead of random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    # Version 7 in bits 48-51, RFC 4122 variant in bits 64-65
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return UUID(int=value)
+
+
+@lru_cache(maxsize=65_536)
+def _parse_uuid(value: str) -> UUID:
+    """Parse a UUID string; ids repeat heavily (account/user FKs), so memoize."""
+    return UUID(value)
+
+
+def _as_uuid(value) -> Optional[UUID]:
+    """Coerce a domain id (str or UUID) to UUID, passing None through."""
+    if not value:
+        return None
+    return value if isinstance(value, UUID) else _parse_uuid(value)
+
+
+# Dialects whose CREATE INDEX takes a WHERE clause
+_PARTIAL_INDEX_DIALECTS = ("postgresql", "sqlite")
+
+
+def _partial_index(name: str, *columns: str, where: str) -> Index:
+    """Index only the rows matching where; not created at all on other dialects."""
+    return Index(
+        name, *columns, postgresql_where=text(where), sqlite_where=text(where)
+    ).ddl_if(dialect=_PARTIAL_INDEX_DIALECTS)
+
+
+def _without_partial_indexes(ddl, target, bind, **kw) -> bool:
+    """ddl_if() check for full fallback indexes on dialects lacking partial ones."""
+    return kw["dialect"].name not in _PARTIAL_INDEX_DIALECTS
 
 
 class GUID(TypeDecorator):
     """Platform-independent GUID type.
     
-    Uses PostgreSQL's UUID type, otherwise uses CHAR(36), storing as stringified hex values.
+    Uses PostgreSQL's UUID type, otherwise uses BINARY(16), storing the raw
+    16 bytes (less than half the width of the textual form in every key and
+    foreign-key index).
     """
-    impl = String
+    impl = BINARY
     cache_ok = True
 
     def load_dialect_impl(self, dialect):
         if dialect.name == 'postgresql':
-            return dialect.type_descriptor(dialect.UUID())
+            return dialect.type_descriptor(PG_UUID(as_uuid=True))
         else:
-            return dialect.type_descriptor(String(36))
+            return dialect.type_descriptor(BINARY(16))
 
     def process_bind_param(self, value, dialect):
         if value is None:
             return value
         elif dialect.name == 'postgresql':
-            return str(value)
+            return value if isinstance(value, UUID) else _parse_uuid(value)
         else:
             if not isinstance(value, UUID):
-                return str(UUID(value))
+                return _parse_uuid(value).bytes
             else:
-                return str(value)
+                return value.bytes
 
     def process_result_value(self, value, dialect):
         if value is None:
             return value
         else:
             if not isinstance(value, UUID):
-                return UUID(value)
+                return UUID(bytes=value)
             return value
 
 
@@ -56,11 +125,11 @@ class UserModel(Base):
     __tablename__ = "users"
     
     # Primary key
-    id = Column(GUID(), primary_key=True, default=uuid4)
+    id = Column(GUID(), primary_key=True, default=_uuid7)
     
     # Basic fields
-    username = Column(String(255), unique=True, nullable=False, index=True)
-    email = Column(String(255), unique=True, nullable=False, index=True)
+    username = Column(String(255), nullable=False)
+    email = Column(String(255), nullable=False)
     full_name = Column(String(255), nullable=True)
     
     # Status and metadata
@@ -70,15 +139,15 @@ class UserModel(Base):
     last_login = Column(DateTime(timezone=True), nullable=True)
     
     # Settings (JSON field)
-    settings = Column(JSON, nullable=True)
+    settings = Column(JSONType, nullable=True)
     
     # Relationships
-    accounts = relationship("AccountModel", back_populates="user", cascade="all, delete-orphan")
+    accounts = relationship("AccountModel", back_populates="user", cascade="all, delete-orphan", lazy="raise_on_sql")
     
     # Indexes
     __table_args__ = (
-        Index('idx_users_username', 'username'),
-        Index('idx_users_email', 'email'),
+        Index('idx_users_username', 'username', unique=True),
+        Index('idx_users_email', 'email', unique=True),
         Index('idx_users_active', 'is_active'),
         Index('idx_users_created_at', 'created_at'),
     )
@@ -93,13 +162,13 @@ class AccountModel(Base):
     __tablename__ = "accounts"
     
     # Primary key
-    id = Column(GUID(), primary_key=True, default=uuid4)
+    id = Column(GUID(), primary_key=True, default=_uuid7)
     
     # Foreign key
     user_id = Column(GUID(), ForeignKey("users.id"), nullable=False)
     
     # Account identification
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     display_name = Column(String(255), nullable=True)
     tenant_id = Column(String(255), nullable=True)
     
@@ -122,21 +191,19 @@ class AccountModel(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Additional settings (JSON field)
-    settings = Column(JSON, nullable=True)
+    settings = Column(JSONType, nullable=True)
     
     # Relationships
-    user = relationship("UserModel", back_populates="accounts")
-    emails = relationship("EmailModel", back_populates="account", cascade="all, delete-orphan")
+    user = relationship("UserModel", back_populates="accounts", lazy="raise_on_sql")
+    emails = relationship("EmailModel", back_populates="account", cascade="all, delete-orphan", lazy="raise_on_sql")
     
     # Constraints and indexes
     __table_args__ = (
         UniqueConstraint('user_id', 'email', name='uq_user_account_email'),
-        Index('idx_accounts_user_id', 'user_id'),
         Index('idx_accounts_email', 'email'),
-        Index('idx_accounts_active', 'is_active'),
-        Index('idx_accounts_authorized', 'is_authorized'),
-        Index('idx_accounts_sync_enabled', 'sync_enabled'),
         Index('idx_accounts_last_sync', 'last_sync_at'),
+        _partial_index('idx_accounts_active_authorized', 'user_id', where="is_active AND is_authorized"),
+        _partial_index('idx_accounts_sync_enabled', 'last_sync_at', where="sync_enabled AND is_active"),
     )
     
     def __repr__(self):
@@ -149,42 +216,42 @@ class EmailModel(Base):
     __tablename__ = "emails"
     
     # Primary key
-    id = Column(GUID(), primary_key=True, default=uuid4)
+    id = Column(GUID(), primary_key=True, default=_uuid7)
     
     # Foreign key
     account_id = Column(GUID(), ForeignKey("accounts.id"), nullable=False)
     
     # Email identification
-    message_id = Column(String(255), nullable=False, unique=True, index=True)
-    conversation_id = Column(String(255), nullable=True, index=True)
+    message_id = Column(String(255), nullable=False)
+    conversation_id = Column(String(255), nullable=True)
     
-    # Email content
+    # Email content; the full body lives in email_bodies (EmailBodyModel) so
+    # list and scan queries don't read it
     subject = Column(Text, nullable=True)
-    body = Column(Text, nullable=True)
     body_preview = Column(Text, nullable=True)
     
     # Email metadata
-    sender = Column(String(255), nullable=True, index=True)
-    recipients = Column(JSON, nullable=True)  # List of recipient emails
-    cc_recipients = Column(JSON, nullable=True)
-    bcc_recipients = Column(JSON, nullable=True)
+    sender = Column(String(255), nullable=True)
+    recipients = Column(JSONType, nullable=True)  # List of recipient emails
+    cc_recipients = Column(JSONType, nullable=True)
+    bcc_recipients = Column(JSONType, nullable=True)
     
     # Timestamps
-    received_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    received_at = Column(DateTime(timezone=True), nullable=True)
     sent_at = Column(DateTime(timezone=True), nullable=True)
     
     # Email properties
-    folder = Column(String(100), nullable=False, default="inbox", index=True)
+    folder = Column(String(100), nullable=False, default="inbox")
     importance = Column(String(20), nullable=True)
     priority = Column(String(20), nullable=True)
     is_read = Column(Boolean, default=False, nullable=False)
     has_attachments = Column(Boolean, default=False, nullable=False)
     
     # Attachments (JSON field)
-    attachments = Column(JSON, nullable=True)
+    attachments = Column(JSONType, nullable=True)
     
     # Processing status
-    processing_status = Column(String(50), default="pending", nullable=False, index=True)
+    processing_status = Column(String(50), default="pending", nullable=False)
     processed_at = Column(DateTime(timezone=True), nullable=True)
     
     # Metadata
@@ -192,37 +259,61 @@ class EmailModel(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Additional metadata (JSON field) - renamed to avoid SQLAlchemy reserved word
-    email_metadata = Column(JSON, nullable=True)
+    email_metadata = Column(JSONType, nullable=True)
     
     # Relationships
-    account = relationship("AccountModel", back_populates="emails")
-    transmission_records = relationship("TransmissionRecordModel", back_populates="email", cascade="all, delete-orphan")
+    account = relationship("AccountModel", back_populates="emails", lazy="raise_on_sql")
+    transmission_records = relationship("TransmissionRecordModel", back_populates="email", cascade="all, delete-orphan", lazy="raise_on_sql")
+    email_body = relationship("EmailBodyModel", back_populates="email", uselist=False, cascade="all, delete-orphan", lazy="raise_on_sql")
     
     # Indexes
     __table_args__ = (
-        Index('idx_emails_account_id', 'account_id'),
-        Index('idx_emails_message_id', 'message_id'),
+        Index('idx_emails_message_id', 'message_id', unique=True),
         Index('idx_emails_conversation_id', 'conversation_id'),
         Index('idx_emails_sender', 'sender'),
         Index('idx_emails_received_at', 'received_at'),
         Index('idx_emails_folder', 'folder'),
-        Index('idx_emails_processing_status', 'processing_status'),
         Index('idx_emails_created_at', 'created_at'),
+        # Any-status lookups (find_by_status/count_by_status), ordered by created_at
+        Index('idx_emails_status_created', 'processing_status', 'created_at'),
         Index('idx_emails_account_received', 'account_id', 'received_at'),
-        Index('idx_emails_account_status', 'account_id', 'processing_status'),
+        # Equality columns first, then the received_at sort/range column
+        Index('idx_emails_account_status', 'account_id', 'processing_status', 'received_at'),
+        Index('idx_emails_account_folder_received', 'account_id', 'folder', 'received_at'),
+        _partial_index('idx_emails_pending', 'created_at', where="processing_status = 'pending'"),
+        # jsonb-only indexes; other backends can't index JSON this way
+        Index('idx_emails_metadata_gin', 'email_metadata', postgresql_using='gin').ddl_if(dialect='postgresql'),
+        Index('idx_emails_meta_category', text("(email_metadata->>'category')")).ddl_if(dialect='postgresql'),
     )
     
     def __repr__(self):
         return f"<EmailModel(id={self.id}, message_id='{self.message_id}', subject='{self.subject[:50] if self.subject else ''}...')>"
 
 
+class EmailBodyModel(Base):
+    """SQLAlchemy model for the body of an Email entity (1-1 with emails)."""
+    
+    __tablename__ = "email_bodies"
+    
+    # Primary key, shared with the owning email
+    email_id = Column(GUID(), ForeignKey("emails.id"), primary_key=True)
+    
+    body = Column(Text, nullable=True)
+    
+    # Relationships
+    email = relationship("EmailModel", back_populates="email_body", lazy="raise_on_sql")
+    
+    def __repr__(self):
+        return f"<EmailBodyModel(email_id={self.email_id})>"
+
+
 class TransmissionRecordModel(Base):
     """SQLAlchemy model for TransmissionRecord entity."""
     
     __tablename__ = "transmission_records"
     
     # Primary key
-    id = Column(GUID(), primary_key=True, default=uuid4)
+    id = Column(GUID(), primary_key=True, default=_uuid7)
     
     # Foreign key
     email_id = Column(GUID(), ForeignKey("emails.id"), nullable=False)
@@ -232,17 +323,17 @@ class TransmissionRecordModel(Base):
     method = Column(String(10), default="POST", nullable=False)
     
     # Status and priority
-    status = Column(String(50), default="pending", nullable=False, index=True)
-    priority = Column(String(20), default="normal", nullable=False, index=True)
+    status = Column(String(50), default="pending", nullable=False)
+    priority = Column(String(20), default="normal", nullable=False)
     
     # Retry management
     retry_count = Column(Integer, default=0, nullable=False)
     max_retries = Column(Integer, default=3, nullable=False)
-    next_retry_at = Column(DateTime(timezone=True), nullable=True, index=True)
+    next_retry_at = Column(DateTime(timezone=True), nullable=True)
     
     # Response data
     response_status_code = Column(Integer, nullable=True)
-    response_data = Column(JSON, nullable=True)
+    response_data = Column(JSONType, nullable=True)
     error_message = Column(Text, nullable=True)
     
     # Timing
@@ -255,17 +346,22 @@ class TransmissionRecordModel(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Additional metadata (JSON field) - renamed to avoid SQLAlchemy reserved word
-    record_metadata = Column(JSON, nullable=True)
+    record_metadata = Column(JSONType, nullable=True)
     
-    # Relationships
-    email = relationship("EmailModel", back_populates="transmission_records")
+    # Relationships; transmission listings almost always show the email, so
+    # it is fetched with one SELECT ... IN per query rather than per row
+    email = relationship("EmailModel", back_populates="transmission_records", lazy="selectin")
     
     # Indexes
     __table_args__ = (
-        Index('idx_transmission_email_id', 'email_id'),
-        Index('idx_transmission_status', 'status'),
         Index('idx_transmission_priority', 'priority'),
-        Index('idx_transmission_retry_at', 'next_retry_at'),
+        _partial_index(
+            'idx_transmission_retry', 'next_retry_at',
+            where="status IN ('pending', 'failed') AND next_retry_at IS NOT NULL"
+        ),
+        # Nothing else covers next_retry_at where the partial index is skipped
+        Index('idx_transmission_retry_at', 'next_retry_at').ddl_if(callable_=_without_partial_indexes),
+        _partial_index('idx_transmission_pending', 'priority', 'created_at', where="status = 'pending'"),
         Index('idx_transmission_created_at', 'created_at'),
         Index('idx_transmission_status_priority', 'status', 'priority'),
         Index('idx_transmission_email_status', 'email_id', 'status'),
@@ -275,11 +371,69 @@ class TransmissionRecordModel(Base):
         return f"<TransmissionRecordModel(id={self.id}, email_id={self.email_id}, status='{self.status}')>"
 
 
+# PostgreSQL also generates ids server-side for rows inserted without one
+# (raw SQL, COPY, other writers). ORM and bulk inserts keep the client-side
+# UUIDv7 default so ids stay time-ordered and known before the INSERT.
+for _table in (UserModel.__table__, AccountModel.__table__, EmailModel.__table__, TransmissionRecordModel.__table__):
+    event.listen(
+        _table,
+        "after_create",
+        DDL("ALTER TABLE %(table)s ALTER COLUMN id SET DEFAULT gen_random_uuid()").execute_if(dialect="postgresql")
+    )
+
+
+# (column, domain attribute) pairs shared by the domain -> model/dict converters
+_EMAIL_COLUMN_MAP = (
+    ("id", "id"),
+    ("account_id", "account_id"),
+    ("message_id", "message_id"),
+    ("conversation_id", "conversation_id"),
+    ("subject", "subject"),
+    ("body_preview", "body_preview"),
+    ("sender", "sender"),
+    ("recipients", "recipients"),
+    ("cc_recipients", "cc_recipients"),
+    ("bcc_recipients", "bcc_recipients"),
+    ("received_at", "received_at"),
+    ("sent_at", "sent_at"),
+    ("folder", "folder"),
+    ("importance", "importance"),
+    ("priority", "priority"),
+    ("is_read", "is_read"),
+    ("has_attachments", "has_attachments"),
+    ("attachments", "attachments"),
+    ("processing_status", "processing_status"),
+    ("processed_at", "processed_at"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+    ("email_metadata", "metadata"),
+)
+
+_TRANSMISSION_RECORD_COLUMN_MAP = (
+    ("id", "id"),
+    ("email_id", "email_id"),
+    ("endpoint", "endpoint"),
+    ("method", "method"),
+    ("status", "status"),
+    ("priority", "priority"),
+    ("retry_count", "retry_count"),
+    ("max_retries", "max_retries"),
+    ("next_retry_at", "next_retry_at"),
+    ("response_status_code", "response_status_code"),
+    ("response_data", "response_data"),
+    ("error_message", "error_message"),
+    ("started_at", "started_at"),
+    ("completed_at", "completed_at"),
+    ("processing_time_ms", "processing_time_ms"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+    ("record_metadata", "metadata"),
+)
+
+
 # Utility functions for model conversion
-def user_model_to_domain(user_model: UserModel):
+def user_model_to_domain(user_model: UserModel) -> User:
     """Convert UserModel to domain User entity."""
-    from core.domain.user import User, UserStatus
-    
     # Convert is_active to status
     status = UserStatus.ACTIVE if user_model.is_active else UserStatus.INACTIVE
     
@@ -297,13 +451,11 @@ def user_model_to_domain(user_model: UserModel):
 
 def domain_user_to_model(user):
     """Convert domain User entity to UserModel."""
-    from core.domain.user import UserStatus
-    
     # Convert status to is_active
     is_active = user.status == UserStatus.ACTIVE if hasattr(user, 'status') else user.is_active()
     
     return UserModel(
-        id=UUID(user.id) if user.id else uuid4(),
+        id=_as_uuid(user.id) or _uuid7(),
         username=user.username,
         email=user.email,
         full_name=user.full_name,
@@ -315,10 +467,8 @@ def domain_user_to_model(user):
     )
 
 
-def account_model_to_domain(account_model: AccountModel):
+def account_model_to_domain(account_model: AccountModel) -> Account:
     """Convert AccountModel to domain Account entity."""
-    from core.domain.account import Account, AccountStatus
-    
     # Convert is_active to status
     if account_model.is_active:
         status = AccountStatus.ACTIVE
@@ -345,14 +495,12 @@ def account_model_to_domain(account_model: AccountModel):
 
 def domain_account_to_model(account):
     """Convert domain Account entity to AccountModel."""
-    from core.domain.account import AccountStatus
-    
     # Convert status to is_active
     is_active = account.status == AccountStatus.ACTIVE if hasattr(account, 'status') else account.is_active()
     
     return AccountModel(
-        id=UUID(account.id) if account.id else uuid4(),
-        user_id=UUID(account.user_id) if isinstance(account.user_id, str) else account.user_id,
+        id=_as_uuid(account.id) or _uuid7(),
+        user_id=_as_uuid(account.user_id),
         email=account.email_address,  # Domain uses 'email_address', DB uses 'email'
         display_name=account.display_name,
         tenant_id=account.tenant_id,
@@ -370,17 +518,22 @@ def domain_account_to_model(account):
     )
 
 
-def email_model_to_domain(email_model: EmailModel):
+def _loaded_body(email_model: EmailModel) -> Optional[str]:
+    """Body text if email_body was loaded with the email; never lazy-loads it."""
+    # Loaded relationships sit in the instance __dict__; unloaded ones don't
+    email_body = email_model.__dict__.get("email_body")
+    return email_body.body if email_body is not None else None
+
+
+def email_model_to_domain(email_model: EmailModel) -> Email:
     """Convert EmailModel to domain Email entity."""
-    from core.domain.email import Email
-    
     return Email(
         id=email_model.id,
         account_id=email_model.account_id,
         message_id=email_model.message_id,
         conversation_id=email_model.conversation_id,
         subject=email_model.subject,
-        body=email_model.body,
+        body=_loaded_body(email_model),
         body_preview=email_model.body_preview,
         sender=email_model.sender,
         recipients=email_model.recipients or [],
@@ -402,40 +555,35 @@ def email_model_to_domain(email_model: EmailModel):
     )
 
 
+def domain_email_to_dict(email) -> Dict[str, Any]:
+    """Convert domain Email entity to a dict of EmailModel column values."""
+    return {column: getattr(email, attribute) for column, attribute in _EMAIL_COLUMN_MAP}
+
+
 def domain_email_to_model(email):
     """Convert domain Email entity to EmailModel."""
-    return EmailModel(
-        id=email.id,
-        account_id=email.account_id,
-        message_id=email.message_id,
-        conversation_id=email.conversation_id,
-        subject=email.subject,
-        body=email.body,
-        body_preview=email.body_preview,
-        sender=email.sender,
-        recipients=email.recipients,
-        cc_recipients=email.cc_recipients,
-        bcc_recipients=email.bcc_recipients,
-        received_at=email.received_at,
-        sent_at=email.sent_at,
-        folder=email.folder,
-        importance=email.importance,
-        priority=email.priority,
-        is_read=email.is_read,
-        has_attachments=email.has_attachments,
-        attachments=email.attachments,
-        processing_status=email.processing_status,
-        processed_at=email.processed_at,
-        created_at=email.created_at,
-        updated_at=email.updated_at,
-        email_metadata=email.metadata
-    )
+    return EmailModel(**domain_email_to_dict(email), email_body=EmailBodyModel(body=email.body))
 
 
-def transmission_record_model_to_domain(record_model: TransmissionRecordModel):
-    """Convert TransmissionRecordModel to domain TransmissionRecord entity."""
-    from core.domain.transmission_record import TransmissionRecord
+def domain_email_to_insert_dict(email) -> Dict[str, Any]:
+    """
+    Convert domain Email entity to a column dict for bulk INSERT/COPY.
     
+    Same columns as domain_email_to_model, without building an ORM instance;
+    ids and timestamps are filled in since no ORM defaults run (aware UTC,
+    since COPY hands them to timestamptz columns as-is).
+    """
+    row = domain_email_to_dict(email)
+    now = datetime.now(timezone.utc)
+    row["id"] = _as_uuid(email.id) or _uuid7()
+    row["account_id"] = _as_uuid(email.account_id)
+    row["created_at"] = email.created_at or now
+    row["updated_at"] = email.updated_at or now
+    return row
+
+
+def transmission_record_model_to_domain(record_model: TransmissionRecordModel) -> TransmissionRecord:
+    """Convert TransmissionRecordModel to domain TransmissionRecord entity."""
     return TransmissionRecord(
         id=record_model.id,
         email_id=record_model.email_id,
@@ -458,25 +606,12 @@ def transmission_record_model_to_domain(record_model: TransmissionRecordModel):
     )
 
 
+def domain_transmission_record_to_dict(record) -> Dict[str, Any]:
+    """Convert domain TransmissionRecord entity to a dict of TransmissionRecordModel column values."""
+    return {column: getattr(record, attribute) for column, attribute in _TRANSMISSION_RECORD_COLUMN_MAP}
+
+
 def domain_transmission_record_to_model(record):
     """Convert domain TransmissionRecord entity to TransmissionRecordModel."""
-    return TransmissionRecordModel(
-        id=record.id,
-        email_id=record.email_id,
-        endpoint=record.endpoint,
-        method=record.method,
-        status=record.status,
-        priority=record.priority,
-        retry_count=record.retry_count,
-        max_retries=record.max_retries,
-        next_retry_at=record.next_retry_at,
-        response_status_code=record.response_status_code,
-        response_data=record.response_data,
-        error_message=record.error_message,
-        started_at=record.started_at,
-        completed_at=record.completed_at,
-        processing_time_ms=record.processing_time_ms,
-        created_at=record.created_at,
-        updated_at=record.updated_at,
-        record_metadata=record.metadata
-    )
+    return TransmissionRecordModel(**domain_transmission_record_to_dict(record))
+
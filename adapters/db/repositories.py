@@ -1,11 +1,12 @@
 """Repository implementations using SQLAlchemy."""
 
+import json
 import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 from uuid import UUID
 
-from sqlalchemy import and_, or_, desc, asc, func, text
+from sqlalchemy import and_, or_, desc, asc, func, insert, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.future import select
@@ -28,6 +29,7 @@ from .models import (
     UserModel,
     AccountModel,
     EmailModel,
+    EmailBodyModel,
     TransmissionRecordModel,
     user_model_to_domain,
     domain_user_to_model,
@@ -35,6 +37,7 @@ from .models import (
     domain_account_to_model,
     email_model_to_domain,
     domain_email_to_model,
+    domain_email_to_insert_dict,
     transmission_record_model_to_domain,
     domain_transmission_record_to_model
 )
@@ -42,6 +45,86 @@ from .models import (
 
 logger = logging.getLogger(__name__)
 
+# Batches larger than this skip the per-row save() path in bulk_save()
+BULK_COPY_THRESHOLD = 100
+
+# Column order for bulk_copy_emails(), matching domain_email_to_insert_dict()
+_EMAIL_COPY_COLUMNS = (
+    "id", "account_id", "message_id", "conversation_id", "subject",
+    "body_preview", "sender", "recipients", "cc_recipients", "bcc_recipients",
+    "received_at", "sent_at", "folder", "importance", "priority", "is_read",
+    "has_attachments", "attachments", "processing_status", "processed_at",
+    "created_at", "updated_at", "email_metadata",
+)
+_EMAIL_JSON_COLUMNS = frozenset({
+    "recipients", "cc_recipients", "bcc_recipients", "attachments", "email_metadata",
+})
+
+
+def _json_or_none(value: Any) -> Optional[str]:
+    """Encode a JSON column value for COPY, keeping None as SQL NULL."""
+    return None if value is None else json.dumps(value)
+
+
+def _with_generated_ids(entities: List[Any], rows: List[Dict[str, Any]]) -> List[Any]:
+    """Return entities with ids assigned by the insert dicts filled in."""
+    return [
+        entity if entity.id else entity.model_copy(update={"id": str(row["id"])})
+        for entity, row in zip(entities, rows)
+    ]
+
+
+async def bulk_copy_emails(session: AsyncSession, emails: List[Email]) -> List[Email]:
+    """
+    Insert new emails with PostgreSQL COPY over the session's asyncpg connection.
+    
+    Bypasses ORM instances and per-row INSERT statements entirely; callers
+    must check the driver (see SQLEmailRepository.bulk_save) and pass only
+    emails that don't exist yet.
+    
+    Returns:
+        The emails as written, with generated ids filled in
+    """
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    
+    rows = [domain_email_to_insert_dict(email) for email in emails]
+    records = [
+        tuple(
+            _json_or_none(row[column]) if column in _EMAIL_JSON_COLUMNS else row[column]
+            for column in _EMAIL_COPY_COLUMNS
+        )
+        for row in rows
+    ]
+    driver_connection = raw_connection.driver_connection
+    await driver_connection.copy_records_to_table(
+        EmailModel.__tablename__,
+        records=records,
+        columns=list(_EMAIL_COPY_COLUMNS)
+    )
+    await driver_connection.copy_records_to_table(
+        EmailBodyModel.__tablename__,
+        records=[(row["id"], email.body) for row, email in zip(rows, emails)],
+        columns=["email_id", "body"]
+    )
+    return _with_generated_ids(emails, rows)
+
+
+async def bulk_insert_emails(session: AsyncSession, emails: List[Email]) -> List[Email]:
+    """
+    Insert new emails (and their bodies) with ORM bulk INSERTs, without ORM instances.
+    
+    Returns:
+        The emails as written, with generated ids filled in
+    """
+    rows = [domain_email_to_insert_dict(email) for email in emails]
+    await session.execute(insert(EmailModel), rows)
+    await session.execute(
+        insert(EmailBodyModel),
+        [{"email_id": row["id"], "body": email.body} for row, email in zip(rows, emails)]
+    )
+    return _with_generated_ids(emails, rows)
+
 
 class SQLUserRepository(UserRepository):
     """SQLAlchemy implementation of UserRepository."""
@@ -338,12 +421,20 @@ class SQLEmailRepository(EmailRepository):
         """Save email to database."""
         try:
             # Check if email already exists
-            existing = await self.session.get(EmailModel, email.id)
+            existing = await self.session.get(
+                EmailModel, email.id, options=[selectinload(EmailModel.email_body)]
+            )
             
             if existing:
                 # Update existing email
                 existing.subject = email.subject
-                existing.body = email.body
+                # Emails read through list queries come back without a body;
+                # don't let saving one of those clear the stored body
+                if email.body is not None:
+                    if existing.email_body is None:
+                        existing.email_body = EmailBodyModel(body=email.body)
+                    else:
+                        existing.email_body.body = email.body
                 existing.body_preview = email.body_preview
                 existing.sender = email.sender
                 existing.recipients = email.recipients
@@ -378,6 +469,9 @@ class SQLEmailRepository(EmailRepository):
     async def bulk_save(self, emails: List[Email]) -> List[Email]:
         """Bulk save emails to database."""
         try:
+            if len(emails) > BULK_COPY_THRESHOLD:
+                return await self._bulk_save_new_rows(emails)
+            
             saved_emails = []
             for email in emails:
                 saved_email = await self.save(email)
@@ -387,10 +481,31 @@ class SQLEmailRepository(EmailRepository):
             logger.error(f"Error bulk saving emails: {e}")
             raise RepositoryError(f"Failed to bulk save emails: {e}")
     
+    async def _bulk_save_new_rows(self, emails: List[Email]) -> List[Email]:
+        """Bulk-write emails that are new (COPY on asyncpg); update existing ones through save()."""
+        ids = [UUID(email.id) if isinstance(email.id, str) else email.id for email in emails if email.id]
+        existing_ids = set()
+        if ids:
+            result = await self.session.execute(select(EmailModel.id).where(EmailModel.id.in_(ids)))
+            existing_ids = {str(email_id) for email_id in result.scalars()}
+        
+        new_emails = [email for email in emails if not email.id or str(email.id) not in existing_ids]
+        connection = await self.session.connection()
+        if connection.dialect.driver == "asyncpg":
+            saved_emails = await bulk_copy_emails(self.session, new_emails)
+        else:
+            saved_emails = await bulk_insert_emails(self.session, new_emails)
+        for email in emails:
+            if email.id and str(email.id) in existing_ids:
+                saved_emails.append(await self.save(email))
+        return saved_emails
+    
     async def find_by_id(self, email_id: UUID) -> Optional[Email]:
         """Find email by ID."""
         try:
-            email_model = await self.session.get(EmailModel, email_id)
+            email_model = await self.session.get(
+                EmailModel, email_id, options=[selectinload(EmailModel.email_body)]
+            )
             return email_model_to_domain(email_model) if email_model else None
         except Exception as e:
             logger.error(f"Error finding email by ID {email_id}: {e}")
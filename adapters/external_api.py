@@ -10,6 +10,8 @@ from uuid import UUID
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+from adapters.common.http_utils import HTTP2_AVAILABLE, HTTPClientUtils
+
 from core.ports.external_api import (
     ExternalAPIPort,
     ExternalAPIError,
@@ -47,8 +49,9 @@ class ExternalAPIAdapter(ExternalAPIPort):
     def _setup_http_client(self) -> None:
         """Setup HTTP client for external API requests."""
         self._http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
+            limits=self.config.get_httpx_limits(),
             headers={
                 "User-Agent": "GraphAPIQuery/1.0",
                 "Accept": "application/json",
@@ -63,6 +66,10 @@ class ExternalAPIAdapter(ExternalAPIPort):
             await self._http_client.aclose()
             logger.info("External API HTTP client closed")
     
+    def _get_shared_client(self) -> httpx.AsyncClient:
+        """Get the process-wide client used for ad-hoc endpoints outside the external API."""
+        return HTTPClientUtils.get_shared_client(self.config.get_httpx_limits())
+    
     # Abstract methods implementation
     async def send_email_data(
         self, 
@@ -226,12 +233,13 @@ class ExternalAPIAdapter(ExternalAPIPort):
             
             logger.info(f"Sending webhook data to {webhook_url}")
             
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    webhook_url, 
-                    json=webhook_data, 
-                    headers=request_headers
-                )
+            client = self._get_shared_client()
+            response = await client.post(
+                webhook_url, 
+                json=webhook_data, 
+                headers=request_headers,
+                timeout=timeout
+            )
             
             await self._handle_response_errors(response)
             
@@ -424,17 +432,17 @@ class ExternalAPIAdapter(ExternalAPIPort):
             logger.info(f"Sending custom payload to {endpoint} via {method}")
             
             # Make request based on method
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                if method.upper() == "POST":
-                    response = await client.post(endpoint, json=payload, headers=request_headers)
-                elif method.upper() == "PUT":
-                    response = await client.put(endpoint, json=payload, headers=request_headers)
-                elif method.upper() == "PATCH":
-                    response = await client.patch(endpoint, json=payload, headers=request_headers)
-                elif method.upper() == "GET":
-                    response = await client.get(endpoint, params=payload, headers=request_headers)
-                else:
-                    raise ExternalAPIError(f"Unsupported HTTP method: {method}")
+            client = self._get_shared_client()
+            if method.upper() == "POST":
+                response = await client.post(endpoint, json=payload, headers=request_headers, timeout=timeout)
+            elif method.upper() == "PUT":
+                response = await client.put(endpoint, json=payload, headers=request_headers, timeout=timeout)
+            elif method.upper() == "PATCH":
+                response = await client.patch(endpoint, json=payload, headers=request_headers, timeout=timeout)
+            elif method.upper() == "GET":
+                response = await client.get(endpoint, params=payload, headers=request_headers, timeout=timeout)
+            else:
+                raise ExternalAPIError(f"Unsupported HTTP method: {method}")
             
             await self._handle_response_errors(response)
             
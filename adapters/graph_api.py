@@ -9,6 +9,8 @@ from urllib.parse import urlencode
 import httpx
 from msal import ConfidentialClientApplication, PublicClientApplication
 
+from adapters.common.http_utils import HTTP2_AVAILABLE
+
 from core.ports.graph_api import (
     GraphAPIPort,
     GraphAPIError,
@@ -63,8 +65,9 @@ class GraphAPIAdapter(GraphAPIPort):
     def _setup_http_client(self) -> None:
         """Setup HTTP client for Graph API requests."""
         self._http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
             timeout=httpx.Timeout(30.0),
-            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+            limits=self.config.get_httpx_limits(),
             headers={
                 "User-Agent": "GraphAPIQuery/1.0",
                 "Accept": "application/json",
@@ -1,5 +1,5 @@
 """Configuration module for GraphAPIQuery project."""
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_settings, clear_settings_cache
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "clear_settings_cache"]
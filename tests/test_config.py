@@ -0,0 +1,85 @@
+"""Test configuration adapter."""
+
+import copy
+import pickle
+
+import pytest
+
+from adapters.config import Environment, create_config_adapter, get_config_adapter
+
+
+@pytest.fixture(autouse=True)
+def _clear_adapter_caches():
+    """Give each test fresh cached adapters and leave none behind."""
+    get_config_adapter.cache_clear()
+    create_config_adapter.cache_clear()
+    yield
+    get_config_adapter.cache_clear()
+    create_config_adapter.cache_clear()
+
+
+def test_reload_settings_updates_cached_adapter(monkeypatch):
+    """Test reload_settings refreshes the cached adapter in place."""
+    monkeypatch.setenv("LOG_LEVEL", "INFO")
+    config = get_config_adapter()
+    assert config.get_log_level() == "INFO"
+
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    config.reload_settings()
+
+    assert get_config_adapter() is config
+    assert create_config_adapter() is config
+    assert config.get_log_level() == "DEBUG"
+    assert config.get_all_settings()["log_level"] == "DEBUG"
+
+
+def test_reload_settings_keeps_environment_override():
+    """Test reload_settings re-applies the environment the adapter was created with."""
+    config = create_config_adapter("test")
+    config.reload_settings()
+
+    assert config.get_environment() == "test"
+    assert create_config_adapter("test") is config
+
+
+@pytest.mark.parametrize("clone", [
+    lambda config: config.model_copy(),
+    lambda config: config.model_copy(deep=True),
+    copy.copy,
+    copy.deepcopy,
+    lambda config: pickle.loads(pickle.dumps(config)),
+])
+def test_copies_keep_slot_state(clone):
+    """Test copied and unpickled adapters keep their per-instance state."""
+    config = create_config_adapter("test")
+    config.get_all_settings()
+
+    copied = clone(config)
+
+    assert copied.validate_required_settings() is True
+    assert copied.is_test()
+    assert copied.get_all_settings() == config.get_all_settings()
+    copied.reload_settings()
+    assert copied.get_environment() == "test"
+
+
+def test_model_copy_update_rederives_environment():
+    """Test model_copy(update=...) refreshes the cached environment checks."""
+    config = create_config_adapter("test")
+
+    copied = config.model_copy(update={"environment": Environment.STAGING})
+
+    assert copied.is_staging()
+    assert not copied.is_test()
+
+
+def test_production_rejects_default_secret_key(monkeypatch):
+    """Test validate_required_settings refuses the placeholder secret key in production."""
+    monkeypatch.setenv("ENVIRONMENT", "production")
+    for name in ("CLIENT_ID", "CLIENT_SECRET", "TENANT_ID", "EXTERNAL_API_URL", "EXTERNAL_API_KEY"):
+        monkeypatch.setenv(name, "configured")
+    monkeypatch.delenv("SECRET_KEY", raising=False)
+    config = create_config_adapter()
+
+    with pytest.raises(ValueError, match="Secret key must be changed"):
+        config.validate_required_settings()
@@ -0,0 +1,163 @@
+"""Test database models and repositories against in-memory SQLite."""
+
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from adapters.db import repositories
+from adapters.db.models import GUID, Base, EmailBodyModel, EmailModel, _loaded_body
+from adapters.db.repositories import BULK_COPY_THRESHOLD, SQLEmailRepository
+
+ACCOUNT_ID = str(uuid4())
+
+
+def _email(**overrides):
+    """Build an email carrying the attributes the persistence converters read."""
+    values = dict(
+        id=str(uuid4()),
+        account_id=ACCOUNT_ID,
+        message_id=f"msg-{uuid4()}",
+        conversation_id=None,
+        subject="Subject",
+        body="Full body",
+        body_preview="Full",
+        sender="sender@example.com",
+        recipients=["to@example.com"],
+        cc_recipients=[],
+        bcc_recipients=[],
+        received_at=None,
+        sent_at=None,
+        folder="inbox",
+        importance=None,
+        priority=None,
+        is_read=False,
+        has_attachments=False,
+        attachments=[],
+        processing_status="pending",
+        processed_at=None,
+        created_at=None,
+        updated_at=None,
+        metadata={},
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+def _model_to_result(email_model):
+    """Stand-in for email_model_to_domain exposing the fields under test."""
+    return SimpleNamespace(
+        id=str(email_model.id),
+        subject=email_model.subject,
+        body=_loaded_body(email_model)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _patch_domain_conversion(monkeypatch):
+    """Return loaded model values instead of domain Email entities."""
+    monkeypatch.setattr(repositories, "email_model_to_domain", _model_to_result)
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """Create an in-memory SQLite schema and a session factory bound to it."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_save_email_body_loaded_by_find_by_id(session_factory):
+    """Test an email saved with its body is read back with it."""
+    email = _email()
+    async with session_factory() as session:
+        await SQLEmailRepository(session).save(email)
+        await session.commit()
+
+    async with session_factory() as session:
+        found = await SQLEmailRepository(session).find_by_id(UUID(email.id))
+
+    assert found.id == email.id
+    assert found.body == "Full body"
+
+
+@pytest.mark.asyncio
+async def test_save_without_body_keeps_stored_body(session_factory):
+    """Test re-saving an email read without its body leaves the body alone."""
+    email = _email()
+    async with session_factory() as session:
+        await SQLEmailRepository(session).save(email)
+        await session.commit()
+
+    async with session_factory() as session:
+        await SQLEmailRepository(session).save(_email(id=email.id, subject="Updated", body=None))
+        await session.commit()
+
+    async with session_factory() as session:
+        found = await SQLEmailRepository(session).find_by_id(UUID(email.id))
+
+    assert found.subject == "Updated"
+    assert found.body == "Full body"
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_above_copy_threshold(session_factory):
+    """Test bulk_save inserts new rows and updates existing ones past the threshold."""
+    existing = _email(subject="Old")
+    async with session_factory() as session:
+        await SQLEmailRepository(session).save(existing)
+        await session.commit()
+
+    new_emails = [_email(body=f"Body {i}") for i in range(BULK_COPY_THRESHOLD + 1)]
+    batch = new_emails + [_email(id=existing.id, subject="New", body="Changed body")]
+    async with session_factory() as session:
+        saved = await SQLEmailRepository(session).bulk_save(batch)
+        await session.commit()
+
+    assert len(saved) == len(batch)
+    async with session_factory() as session:
+        email_count = await session.scalar(select(func.count()).select_from(EmailModel))
+        body_count = await session.scalar(select(func.count()).select_from(EmailBodyModel))
+        found_new = await SQLEmailRepository(session).find_by_id(UUID(new_emails[0].id))
+        found_existing = await SQLEmailRepository(session).find_by_id(UUID(existing.id))
+
+    assert email_count == len(batch)
+    assert body_count == len(batch)
+    assert found_new.body == "Body 0"
+    assert found_existing.subject == "New"
+    assert found_existing.body == "Changed body"
+
+
+@pytest.mark.asyncio
+async def test_guid_round_trip(session_factory):
+    """Test GUID columns accept string ids and read back as UUIDs."""
+    email = _email()
+    async with session_factory() as session:
+        await SQLEmailRepository(session).save(email)
+        await session.commit()
+
+    async with session_factory() as session:
+        email_model = await session.get(EmailModel, email.id)
+
+    assert email_model.id == UUID(email.id)
+    assert email_model.account_id == UUID(ACCOUNT_ID)
+
+
+def test_guid_bind_values_per_dialect():
+    """Test GUID binds 16 raw bytes, or a UUID object on PostgreSQL."""
+    value = uuid4()
+    guid = GUID()
+
+    stored = guid.process_bind_param(str(value), sqlite.dialect())
+    assert stored == value.bytes
+    assert guid.process_result_value(stored, sqlite.dialect()) == value
+
+    assert guid.process_bind_param(str(value), postgresql.dialect()) == value
+    assert guid.process_result_value(value, postgresql.dialect()) == value